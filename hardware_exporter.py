@@ -6,25 +6,55 @@ Requirements:
     - LibreHardwareMonitor running with HTTP server enabled (preferred) or WMI enabled (fallback)
     - Python 3.8+
     - pip install prometheus-client requests pywin32
+    - Optional: pip install orjson (faster parsing of large data.json responses)
 """
 
 import time
 import logging
+import math
 import re
 import argparse
 import requests
 import json
-from typing import Dict, List, Optional
-from collections import defaultdict
-from prometheus_client import start_http_server, Gauge, Info
-
-# Try to import WMI for fallback (optional)
+from typing import Dict, List, NamedTuple, Optional
+from collections import Counter, defaultdict
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from prometheus_client import start_http_server, Info, REGISTRY
+from prometheus_client.core import GaugeMetricFamily
+
+# Try to import pywin32 COM support for the WMI fallback (optional)
 try:
-    import wmi
+    import pythoncom
+    import win32com.client
     WMI_AVAILABLE = True
 except ImportError:
     WMI_AVAILABLE = False
-    wmi = None
+    pythoncom = None
+    win32com = None
+
+# Try to import orjson for faster JSON parsing (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Both parse the raw response bytes directly
+json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# (connect, read) timeout for LibreHardwareMonitor HTTP requests, in seconds
+HTTP_TIMEOUT = (2, 10)
+
+# WMI namespace LibreHardwareMonitor registers its provider under
+LHM_WMI_NAMESPACE = "root\\LibreHardwareMonitor"
+
+# ExecQuery flags: wbemFlagReturnImmediately | wbemFlagForwardOnly
+WBEM_FLAGS_FAST_QUERY = 0x10 | 0x20
+
+# Impersonation level for the WMI connection (wbemImpersonationLevelImpersonate)
+WBEM_IMPERSONATION_IMPERSONATE = 3
 
 # Sensor Filtering Configuration
 # Control which sensor types and components to monitor for performance optimization
@@ -51,36 +81,86 @@ SENSOR_FILTER_CONFIG = {
     'diagnostic': 'all'  # Include all sensors found
 }
 
+# Substrings identifying the top-level hardware component of a sensor path.
+# Checked in order: GPU first to avoid false matches (e.g. "amd rx" vs "amdcpu"),
+# then CPU, memory ("Generic Memory" -> "genericmemory"), motherboard, storage, network.
+HARDWARE_COMPONENT_KEYWORDS = (
+    ('gpu', ("gpu", "nvidia", "geforce", "radeon", "rtx", "gtx", "quadro", "amd rx")),
+    ('cpu', ("cpu", "amdcpu", "intelcpu", "ryzen", "threadripper", "epyc", "xeon", "corei", "processor")),
+    ('memory', ("memory", "ram", "genericmemory")),
+    ('motherboard', ("motherboard", "mainboard", "asrock", "asus", "msi", "gigabyte", "nuvoton", "nct", "lpc")),
+    ('storage', ("ssd", "hdd", "nvme", "samsung", "wdc", "seagate", "toshiba", "storage", "disk")),
+    ('network', ("ethernet", "network", "nic", "bluetooth", "wifi", "tailscale")),
+)
+
+# One compiled alternation per component, so each category is a single scan
+# of the path segment instead of one substring search per keyword
+_HARDWARE_COMPONENT_PATTERNS = tuple(
+    (component, re.compile('|'.join(map(re.escape, keywords))))
+    for component, keywords in HARDWARE_COMPONENT_KEYWORDS
+)
+
+# Numbered sensor names, e.g. "Core #3", "GPU Fan 1", "Chassis Fan #2" (group 1 = number)
+_CORE_NUM_RE = re.compile(r'Core #(\d+)')
+_CORE_SMU_RE = re.compile(r'Core #(\d+).*SMU')
+_TEMPERATURE_NUM_RE = re.compile(r'Temperature #(\d+)')
+_VOLTAGE_NUM_RE = re.compile(r'Voltage #(\d+)')
+_GPU_FAN_RE = re.compile(r'GPU Fan (\d+)')
+_CHASSIS_FAN_RE = re.compile(r'Chassis Fan #(\d+)')
+
+# Fallback metric name cleanup
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_UNDERSCORES_RE = re.compile(r'_+')
+
+# Placeholder strings LibreHardwareMonitor uses for a missing reading (compared lowercased)
+_MISSING_VALUES = frozenset(("n/a", "null", "none"))
+
+# Digit group separators inside a number, e.g. "1 850 RPM", "1\xa0234,5 MB"
+_DIGIT_GROUP_SEP_RE = re.compile(r"(?<=\d)[\s']+(?=\d)")
+
+# A bare decimal number such as a string RawValue ("45.2") - no exponent, inf or nan
+_PLAIN_NUMBER_RE = re.compile(r'[-+]?\d+(?:\.\d+)?')
+
+# A formatted sensor value: the number, then only the unit, e.g. "45.2 °C", "1850 RPM", "45,2 °C"
+_VALUE_NUMBER_RE = re.compile(r'\s*([-+]?\d+(?:[.,]\d+)?)\D*$')
+
+# Hardware node names used for the system info metric
+_CPU_NAME_KEYWORDS = ("intel", "amd", "ryzen", "core i", "threadripper", "epyc")
+_CPU_NAME_EXCLUDES = ("gpu", "graphics", "radeon rx", "geforce")
+_GPU_NAME_KEYWORDS = ("nvidia", "geforce", "quadro", "rtx", "gtx", "radeon", "rx ")
+_MOTHERBOARD_NAME_KEYWORDS = ("motherboard", "mainboard", "asus", "msi", "gigabyte", "asrock", "evga")
+
+# Sensor types that can't legitimately read below zero - negative values are dropped
+NON_NEGATIVE_SENSOR_TYPES = frozenset(("Temperature", "Load", "Clock", "Power", "Fan"))
+
+# Sensor paths and names called out in the debug breakdown
+_GPU_PARENT_RE = re.compile(r'gpu|geforce|nvidia')
+_CRITICAL_SENSOR_NAME_RE = re.compile(r'GPU Memory Free|GPU Memory Used|GPU Memory Total|GPU Core|Package')
+
 # Default monitoring mode - can be changed via command line
 DEFAULT_SENSOR_MODE = 'essential'  # Options: 'essential', 'extended', 'diagnostic'
 
-def should_include_sensor(sensor_type: str, component_type: str, mode: str = DEFAULT_SENSOR_MODE) -> bool:
+def get_included_sensors(mode: str = DEFAULT_SENSOR_MODE) -> Optional[frozenset]:
     """
-    Determine if a sensor should be included based on filtering configuration.
+    Get the (component_type, sensor_type) pairs a monitoring mode includes.
     
     Args:
-        sensor_type: Type of sensor (Temperature, Load, Fan, etc.)
-        component_type: Component type (cpu, gpu, motherboard, etc.)
         mode: Monitoring mode ('essential', 'extended', 'diagnostic')
     
     Returns:
-        True if sensor should be included, False otherwise
+        Frozenset of included pairs, or None if the mode includes every sensor
     """
     if mode == 'diagnostic':
-        return True
+        return None
     
-    # Check essential sensors first (always included)
-    essential = SENSOR_FILTER_CONFIG.get('essential', {})
-    if component_type in essential and sensor_type in essential[component_type]:
-        return True
-    
-    # Check extended sensors if in extended mode
-    if mode == 'extended':
-        extended = SENSOR_FILTER_CONFIG.get('extended', {})
-        if component_type in extended and sensor_type in extended[component_type]:
-            return True
-    
-    return False
+    tiers = ['essential', 'extended'] if mode == 'extended' else ['essential']
+    return frozenset(
+        (component_type, sensor_type)
+        for tier in tiers
+        for component_type, sensor_types in SENSOR_FILTER_CONFIG.get(tier, {}).items()
+        for sensor_type in sensor_types
+    )
 
 # Sensor Mapping Configuration
 # Note: Most mappings are now handled dynamically in get_standardized_metric_name()
@@ -88,6 +168,79 @@ def should_include_sensor(sensor_type: str, component_type: str, mode: str = DEF
 # This avoids ambiguity issues with sensors that have the same name but different meanings
 # (e.g., "GPU Core" appears in Temperature, Load, and Clock sensor types).
 
+# Exact-name context mappings, looked up before the substring patterns below.
+# Keyed by (component_type, sensor_type_lower, sensor_name) - case-sensitive names
+_CONTEXT_EXACT_MAPPINGS = {
+    ('gpu', 'temperature', 'GPU Core'): 'gpu_temp_core',
+    ('gpu', 'load', 'GPU Bus'): 'gpu_load_bus',
+    ('gpu', 'load', 'GPU Power'): 'gpu_load_power',
+    ('gpu', 'clock', 'GPU Core'): 'gpu_core_clock',
+    ('gpu', 'clock', 'GPU Memory'): 'gpu_memory_clock',
+    ('cpu', 'temperature', 'Core Max'): 'cpu_core_max_temp',
+    ('cpu', 'temperature', 'Core Average'): 'cpu_core_avg_temp',
+    ('cpu', 'load', 'CPU Total'): 'cpu_load_total',
+    ('cpu', 'load', 'CPU Core Max'): 'cpu_core_max_load',
+}
+
+# GPU memory sizes (Data/SmallData type)
+for _data_type in ('data', 'smalldata'):
+    for _prefix in ('GPU Memory', 'D3D Dedicated Memory', 'D3D Shared Memory'):
+        for _suffix in ('Free', 'Used', 'Total'):
+            _CONTEXT_EXACT_MAPPINGS[('gpu', _data_type, f'{_prefix} {_suffix}')] = f'gpu_memory_{_suffix.lower()}'
+del _data_type, _prefix, _suffix
+
+# Same, keyed by (component_type, sensor_type_lower, sensor_name_lower)
+_CONTEXT_LOWER_MAPPINGS = {
+    ('gpu', 'temperature', 'core'): 'gpu_temp_core',
+    ('gpu', 'load', 'core'): 'gpu_load_core',
+    ('gpu', 'load', 'gpu core'): 'gpu_load_core',
+    ('gpu', 'load', 'gpu memory'): 'gpu_memory_load',
+    ('gpu', 'load', 'bus'): 'gpu_load_bus',
+    ('gpu', 'load', 'power'): 'gpu_load_power',
+    ('gpu', 'clock', 'core'): 'gpu_core_clock',
+    ('gpu', 'clock', 'memory'): 'gpu_memory_clock',
+    ('memory', 'load', 'memory'): 'memory_load',
+    ('cpu', 'power', 'core'): 'cpu_core_power',
+}
+
+# Static mappings, only for clearly unambiguous sensor names. Checked after the
+# context-aware and numbered patterns, since e.g. "Used Space" must not shadow
+# the GPU memory "used" match
+_UNAMBIGUOUS_MAPPINGS = {
+    # CPU sensors with unique names
+    'Bus Speed': 'cpu_bus_speed',
+    
+    # Motherboard sensors
+    'CPU': 'motherboard_cpu_temp',
+    'Motherboard': 'motherboard_temp',
+    'Vcore': 'motherboard_vcore',
+    'AVCC': 'motherboard_avcc',
+    '+3.3V': 'motherboard_3v3',
+    '+3V Standby': 'motherboard_3v_standby',
+    'CPU Termination': 'motherboard_cpu_termination',
+    '+12V': 'motherboard_12v',
+    '+5V': 'motherboard_5v',
+    'Battery': 'motherboard_battery',
+    'CPU Fan': 'motherboard_cpu_fan',
+    'System Fan': 'motherboard_system_fan',
+    
+    # Storage sensors
+    'Used Space': 'drive_used_space',
+    'Free Space': 'drive_free_space',
+    'Total Activity': 'drive_total_activity',
+    'Read Rate': 'drive_read_rate',
+    'Write Rate': 'drive_write_rate',
+    'Read Activity': 'drive_read_activity',
+    'Write Activity': 'drive_write_activity',
+    
+    # Network sensors
+    'Download Speed': 'network_download_speed',
+    'Upload Speed': 'network_upload_speed',
+    'Data Downloaded': 'network_data_downloaded',
+    'Data Uploaded': 'network_data_uploaded',
+}
+
+@lru_cache(maxsize=4096)
 def get_standardized_metric_name(sensor_name: str, component_type: str = '', sensor_type: str = '') -> str:
     """
     Get standardized Prometheus metric name for a sensor.
@@ -108,13 +261,17 @@ def get_standardized_metric_name(sensor_name: str, component_type: str = '', sen
     # These must be checked BEFORE static mappings to avoid ambiguous matches
     # =========================================================================
     
+    # Exact names are a single dict lookup; only misses reach the substring checks
+    metric_name = (_CONTEXT_EXACT_MAPPINGS.get((component_type, sensor_type_lower, sensor_name))
+                   or _CONTEXT_LOWER_MAPPINGS.get((component_type, sensor_type_lower, sensor_name_lower)))
+    if metric_name:
+        return metric_name
+    
     # GPU context-aware patterns - check component AND sensor type together
     if component_type == 'gpu':
         # GPU Temperature sensors
         if sensor_type_lower == 'temperature':
-            if sensor_name == 'GPU Core' or sensor_name_lower == 'core':
-                return 'gpu_temp_core'
-            elif 'memory' in sensor_name_lower and 'junction' in sensor_name_lower:
+            if 'memory' in sensor_name_lower and 'junction' in sensor_name_lower:
                 return 'gpu_temp_memory_junction'
             elif 'memory' in sensor_name_lower:
                 return 'gpu_temp_memory'
@@ -123,41 +280,22 @@ def get_standardized_metric_name(sensor_name: str, component_type: str = '', sen
         
         # GPU Load sensors
         elif sensor_type_lower == 'load':
-            if sensor_name == 'GPU Core' or sensor_name_lower in ['core', 'gpu core']:
-                return 'gpu_load_core'
-            elif sensor_name == 'GPU Memory' or sensor_name_lower == 'gpu memory':
-                return 'gpu_memory_load'  # Memory usage percentage
-            elif 'memory controller' in sensor_name_lower:
+            if 'memory controller' in sensor_name_lower:
                 return 'gpu_load_memory_controller'
-            elif 'video engine' in sensor_name_lower or sensor_name_lower == 'video engine':
+            elif 'video engine' in sensor_name_lower:
                 return 'gpu_load_video_engine'
             elif '3d' in sensor_name_lower or 'd3d' in sensor_name_lower:
                 return 'gpu_load_3d'
-            elif sensor_name_lower == 'bus' or sensor_name == 'GPU Bus':
-                return 'gpu_load_bus'
-            elif sensor_name_lower == 'power' or sensor_name == 'GPU Power':
-                return 'gpu_load_power'
         
         # GPU Clock sensors
         elif sensor_type_lower == 'clock':
-            if sensor_name == 'GPU Core' or sensor_name_lower == 'core':
-                return 'gpu_core_clock'
-            elif sensor_name == 'GPU Memory' or sensor_name_lower == 'memory':
-                return 'gpu_memory_clock'
-            elif 'shader' in sensor_name_lower:
+            if 'shader' in sensor_name_lower:
                 return 'gpu_shader_clock'
         
         # GPU Memory sensors (Data/SmallData type) - memory sizes in MB
         elif sensor_type_lower in ['data', 'smalldata']:
-            # Explicit name matches first
-            if sensor_name in ['GPU Memory Free', 'D3D Dedicated Memory Free', 'D3D Shared Memory Free']:
-                return 'gpu_memory_free'
-            elif sensor_name in ['GPU Memory Used', 'D3D Dedicated Memory Used', 'D3D Shared Memory Used']:
-                return 'gpu_memory_used'
-            elif sensor_name in ['GPU Memory Total', 'D3D Dedicated Memory Total', 'D3D Shared Memory Total']:
-                return 'gpu_memory_total'
-            # Partial matches
-            elif 'free' in sensor_name_lower:
+            # Partial matches (explicit names are in _CONTEXT_EXACT_MAPPINGS)
+            if 'free' in sensor_name_lower:
                 return 'gpu_memory_free'
             elif 'used' in sensor_name_lower:
                 return 'gpu_memory_used'
@@ -173,9 +311,9 @@ def get_standardized_metric_name(sensor_name: str, component_type: str = '', sen
         
         # GPU Fan sensors
         elif sensor_type_lower == 'fan':
-            if re.match(r'^GPU Fan \d+', sensor_name):
-                fan_num = re.search(r'Fan (\d+)', sensor_name).group(1)
-                return f"gpu_fan_{fan_num}_speed"
+            fan_match = _GPU_FAN_RE.match(sensor_name)
+            if fan_match:
+                return f"gpu_fan_{fan_match.group(1)}_speed"
             else:
                 return 'gpu_fan_speed'
     
@@ -183,9 +321,7 @@ def get_standardized_metric_name(sensor_name: str, component_type: str = '', sen
     elif component_type == 'memory':
         # Memory Load sensors
         if sensor_type_lower == 'load':
-            if sensor_name == 'Memory' or sensor_name_lower == 'memory':
-                return 'memory_load'
-            elif 'virtual' in sensor_name_lower:
+            if 'virtual' in sensor_name_lower:
                 return 'memory_virtual_load'
         
         # Memory Data sensors - distinguish physical vs virtual memory
@@ -211,24 +347,11 @@ def get_standardized_metric_name(sensor_name: str, component_type: str = '', sen
                 return 'cpu_temp_ccd1'
             elif 'ccd2' in sensor_name_lower:
                 return 'cpu_temp_ccd2'
-            elif sensor_name == 'Core Max':
-                return 'cpu_core_max_temp'
-            elif sensor_name == 'Core Average':
-                return 'cpu_core_avg_temp'
         
         # CPU Power sensors
         elif sensor_type_lower == 'power':
-            if 'package' in sensor_name_lower or sensor_name_lower == 'package':
+            if 'package' in sensor_name_lower:
                 return 'cpu_package_power'
-            elif sensor_name_lower == 'core':
-                return 'cpu_core_power'
-        
-        # CPU Load sensors
-        elif sensor_type_lower == 'load':
-            if sensor_name == 'CPU Total':
-                return 'cpu_load_total'
-            elif sensor_name == 'CPU Core Max':
-                return 'cpu_core_max_load'
         
         # CPU Voltage sensors
         elif sensor_type_lower == 'voltage':
@@ -242,8 +365,8 @@ def get_standardized_metric_name(sensor_name: str, component_type: str = '', sen
     # =========================================================================
     
     # CPU Core patterns: "Core #1", "Core #2", etc.
-    if re.match(r'^Core #\d+', sensor_name):
-        core_num = re.search(r'#(\d+)', sensor_name).group(1)
+    if (core_match := _CORE_NUM_RE.match(sensor_name)):
+        core_num = core_match.group(1)
         if sensor_type_lower == 'load':
             return f"cpu_core_{core_num}_load"
         elif sensor_type_lower == 'temperature':
@@ -254,71 +377,32 @@ def get_standardized_metric_name(sensor_name: str, component_type: str = '', sen
             return f"cpu_core_{core_num}_power"
     
     # CPU Core Power patterns with SMU: "Core #1 (SMU)", etc.
-    elif re.match(r'^Core #\d+.*SMU', sensor_name):
-        core_num = re.search(r'#(\d+)', sensor_name).group(1)
-        return f"cpu_core_{core_num}_power"
+    elif (core_match := _CORE_SMU_RE.match(sensor_name)):
+        return f"cpu_core_{core_match.group(1)}_power"
     
     # Motherboard Temperature patterns: "Temperature #1", "Temperature #2", etc.
-    elif re.match(r'^Temperature #\d+', sensor_name):
-        temp_num = re.search(r'#(\d+)', sensor_name).group(1)
-        return f"motherboard_temp_{temp_num}"
+    elif (temp_match := _TEMPERATURE_NUM_RE.match(sensor_name)):
+        return f"motherboard_temp_{temp_match.group(1)}"
     
     # Motherboard Voltage patterns: "Voltage #1", "Voltage #2", etc.
-    elif re.match(r'^Voltage #\d+', sensor_name):
-        volt_num = re.search(r'#(\d+)', sensor_name).group(1)
-        return f"motherboard_voltage_{volt_num}"
+    elif (volt_match := _VOLTAGE_NUM_RE.match(sensor_name)):
+        return f"motherboard_voltage_{volt_match.group(1)}"
     
     # Chassis Fan patterns: "Chassis Fan #1", "Chassis Fan #2", etc.
-    elif re.match(r'^Chassis Fan #\d+', sensor_name):
-        fan_num = re.search(r'#(\d+)', sensor_name).group(1)
-        return f"motherboard_chassis_fan_{fan_num}"
+    elif (fan_match := _CHASSIS_FAN_RE.match(sensor_name)):
+        return f"motherboard_chassis_fan_{fan_match.group(1)}"
     
     # GPU Fan patterns (fallback): "GPU Fan 1", "GPU Fan 2", etc.
-    elif re.match(r'^GPU Fan \d+', sensor_name):
-        fan_num = re.search(r'Fan (\d+)', sensor_name).group(1)
-        return f"gpu_fan_{fan_num}_speed"
+    elif (fan_match := _GPU_FAN_RE.match(sensor_name)):
+        return f"gpu_fan_{fan_match.group(1)}_speed"
     
     # =========================================================================
     # STATIC MAPPINGS (only for unambiguous sensor names)
     # =========================================================================
     
-    # Only use static mapping for clearly unambiguous names
-    unambiguous_mappings = {
-        # CPU sensors with unique names
-        'Bus Speed': 'cpu_bus_speed',
-        
-        # Motherboard sensors
-        'CPU': 'motherboard_cpu_temp',
-        'Motherboard': 'motherboard_temp',
-        'Vcore': 'motherboard_vcore',
-        'AVCC': 'motherboard_avcc',
-        '+3.3V': 'motherboard_3v3',
-        '+3V Standby': 'motherboard_3v_standby',
-        'CPU Termination': 'motherboard_cpu_termination',
-        '+12V': 'motherboard_12v',
-        '+5V': 'motherboard_5v',
-        'Battery': 'motherboard_battery',
-        'CPU Fan': 'motherboard_cpu_fan',
-        'System Fan': 'motherboard_system_fan',
-        
-        # Storage sensors
-        'Used Space': 'drive_used_space',
-        'Free Space': 'drive_free_space',
-        'Total Activity': 'drive_total_activity',
-        'Read Rate': 'drive_read_rate',
-        'Write Rate': 'drive_write_rate',
-        'Read Activity': 'drive_read_activity',
-        'Write Activity': 'drive_write_activity',
-        
-        # Network sensors
-        'Download Speed': 'network_download_speed',
-        'Upload Speed': 'network_upload_speed',
-        'Data Downloaded': 'network_data_downloaded',
-        'Data Uploaded': 'network_data_uploaded',
-    }
-    
-    if sensor_name in unambiguous_mappings:
-        return unambiguous_mappings[sensor_name]
+    metric_name = _UNAMBIGUOUS_MAPPINGS.get(sensor_name)
+    if metric_name:
+        return metric_name
     
     # =========================================================================
     # FALLBACK: Generate metric name from sensor name
@@ -327,10 +411,10 @@ def get_standardized_metric_name(sensor_name: str, component_type: str = '', sen
     metric_name = sensor_name_lower
     
     # Clean up common patterns
-    metric_name = re.sub(r'[^\w\s]', '', metric_name)  # Remove special chars
-    metric_name = re.sub(r'\s+', '_', metric_name)     # Replace spaces with underscores
-    metric_name = re.sub(r'_+', '_', metric_name)      # Remove multiple underscores
-    metric_name = metric_name.strip('_')               # Remove leading/trailing underscores
+    metric_name = _SPECIAL_CHARS_RE.sub('', metric_name)  # Remove special chars
+    metric_name = _WHITESPACE_RE.sub('_', metric_name)    # Replace spaces with underscores
+    metric_name = _UNDERSCORES_RE.sub('_', metric_name)   # Remove multiple underscores
+    metric_name = metric_name.strip('_')                 # Remove leading/trailing underscores
     
     # Add component type prefix if not already present
     if component_type and not metric_name.startswith(component_type):
@@ -345,52 +429,101 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Dynamic Prometheus metrics - created on demand for HTTP API sensors
-hardware_metrics = {}
+# Valid Prometheus metric name - checked once per sensor, since an invalid name
+# raised from collect() would fail the whole scrape
+METRIC_NAME_RE = re.compile(r'^[a-zA-Z_:][a-zA-Z0-9_:]*$')
+
+# Prometheus unit and description for each LibreHardwareMonitor sensor type
+_UNIT_MAP = {
+    'Temperature': 'celsius', 'Load': 'percent', 'Clock': 'mhz', 
+    'Power': 'watts', 'Fan': 'rpm', 'Voltage': 'volts',
+    'Data': 'megabytes', 'SmallData': 'megabytes', 'Throughput': 'mb_per_sec'
+}
+
+_TYPE_DESCRIPTIONS = {
+    'Temperature': 'Temperature reading',
+    'Load': 'Load percentage',
+    'Clock': 'Clock frequency',
+    'Power': 'Power consumption',
+    'Fan': 'Fan speed',
+    'Voltage': 'Voltage level',
+    'Data': 'Data size',
+    'SmallData': 'Data size',
+    'Throughput': 'Data throughput'
+}
+
+# Complete help text for every known sensor type
+_HELP_TEXTS = {
+    sensor_type: f"{_TYPE_DESCRIPTIONS[sensor_type]} in {unit}"
+    for sensor_type, unit in _UNIT_MAP.items()
+}
 
-def get_or_create_metric(metric_name: str, sensor_type: str, help_text: str = ""):
+def get_metric_help_text(sensor_type: str) -> str:
     """
-    Get existing metric or create new one dynamically for HTTP API sensors.
+    Build the help text for a sensor metric from its sensor type.
     
     Args:
-        metric_name: Standardized metric name  
         sensor_type: Type of sensor (Temperature, Load, etc.)
-        help_text: Help text for the metric
     
     Returns:
-        Prometheus Gauge metric
+        Help text such as "Temperature reading in celsius"
     """
-    if metric_name not in hardware_metrics:
-        # Create appropriate help text if not provided
-        if not help_text:
-            unit_map = {
-                'Temperature': 'celsius', 'Load': 'percent', 'Clock': 'mhz', 
-                'Power': 'watts', 'Fan': 'rpm', 'Voltage': 'volts',
-                'Data': 'megabytes', 'SmallData': 'megabytes', 'Throughput': 'mb_per_sec'
-            }
-            unit = unit_map.get(sensor_type, 'units')
-            
-            # Create descriptive help text based on sensor type
-            type_descriptions = {
-                'Temperature': 'Temperature reading',
-                'Load': 'Load percentage',
-                'Clock': 'Clock frequency',
-                'Power': 'Power consumption',
-                'Fan': 'Fan speed',
-                'Voltage': 'Voltage level',
-                'Data': 'Data size',
-                'SmallData': 'Data size',
-                'Throughput': 'Data throughput'
-            }
-            description = type_descriptions.get(sensor_type, sensor_type)
-            help_text = f"{description} in {unit}"
-        
-        # Create the metric with rigbeat prefix and no labels (metric name is descriptive enough)
-        full_metric_name = f"rigbeat_{metric_name}"
-        hardware_metrics[metric_name] = Gauge(full_metric_name, help_text)
-        logger.debug(f"Created new metric: {full_metric_name}")
-    
-    return hardware_metrics[metric_name]
+    help_text = _HELP_TEXTS.get(sensor_type)
+    if help_text is None:
+        # Unknown sensor type - describe it by its own name
+        help_text = f"{sensor_type} in units"
+    return help_text
+
+
+class SensorCollector:
+    """
+    Prometheus collector exposing the latest sensor snapshot.
+
+    update_metrics builds a plain dict of metric name -> (help text, value) and
+    swaps it in with a single assignment, so a scrape always sees one complete
+    update and setting a value is a dict write rather than a locked Gauge.set().
+    Metrics carry the rigbeat_ prefix and no labels (metric name is descriptive).
+    """
+
+    def __init__(self):
+        self._samples = {}
+
+    def update(self, samples: Dict) -> bool:
+        """Replace the exposed snapshot with a freshly built one, returning whether it changed"""
+        changed = samples != self._samples
+        self._samples = samples
+        return changed
+
+    def describe(self):
+        # Metric names depend on the detected hardware - nothing to pre-register
+        return []
+
+    def collect(self):
+        for metric_name, (help_text, value) in self._samples.items():
+            yield GaugeMetricFamily(f"rigbeat_{metric_name}", help_text, value=value)
+
+
+class Sensor(NamedTuple):
+    """One sensor reading from data.json or a WMI row (field names match the WMI Sensor class)"""
+    SensorType: str
+    Name: str
+    Value: float
+    Parent: str
+
+
+class SensorRoute:
+    """Cached routing decision for one sensor: its metric name and help text"""
+
+    # One instance per sensor lives for the whole process - no per-instance __dict__
+    __slots__ = ('metric_name', 'help_text')
+
+    def __init__(self, metric_name: str, help_text: Optional[str]):
+        self.metric_name = metric_name
+        self.help_text = help_text  # None if the sensor is filtered out or unusable
+
+
+sensor_collector = SensorCollector()
+REGISTRY.register(sensor_collector)
 
 system_info = Info('rigbeat_system', 'System information')
 
@@ -402,15 +535,24 @@ class HardwareMonitor:
         self.http_host = http_host
         self.http_port = http_port
         self.http_url = f"http://{http_host}:{http_port}"
+        self._data_url = f"{self.http_url}/data.json"  # Fetched on every update
         self.sensor_mode = sensor_mode
+        self._included_sensors = get_included_sensors(sensor_mode)  # None = include everything
         self.use_http = False
         self.connected = False
-        self.w = None
+        self.wbem = None  # SWbemServices connection (WMI fallback only)
+        self._com_initialized = False  # Balanced by close()
 
         # Performance optimizations
         self._session = None  # Reuse HTTP connections
-        self._compiled_patterns = self._compile_regex_patterns()  # Cache regex patterns
-        self._sensor_filter_cache = {}  # Cache sensor categorization
+        self._system_info = None  # Detected hardware names, fixed for the process lifetime
+        self._last_payload = None  # Last data.json body and the sensors parsed from it
+        self._last_sensors = None
+        self._probe_document = None  # data.json parsed by the connection probe, until system info uses it
+        self._published_sensors = None  # Sensor list behind the current metrics snapshot
+        self._route_cache = {}  # (type, name, parent) -> SensorRoute
+        self._component_cache = {}  # parent path -> hardware component
+        self._filtered_out_count = 0  # HTTP sensors the mode excluded during the last tree walk
 
         # Try HTTP API first (performance optimized)
         self._try_http_connection()
@@ -419,30 +561,36 @@ class HardwareMonitor:
         if not self.use_http:
             self._try_wmi_connection()
 
-    def _compile_regex_patterns(self):
-        """Pre-compile regex patterns for better performance"""
-        return {
-            'fan_numbers': re.compile(r'\d+'),
-            'fan_sanitize': re.compile(r'[^a-zA-Z0-9_]'),
-            'fan_underscore': re.compile(r'_+')
-        }
-
     def _get_http_session(self):
         """Get or create HTTP session for connection reuse"""
         if self._session is None:
+            # One sequential poller - a single pooled keep-alive connection is enough.
+            # No adapter-level retries: _fetch_data_json retries a dropped connection once,
+            # and read timeouts aren't retried so one stalled request can't hold up an update
             self._session = requests.Session()
-            self._session.timeout = 10
+            self._session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0))
         return self._session
 
+    def _fetch_data_json(self):
+        """GET data.json over the shared session, retrying once on a dropped connection"""
+        session = self._get_http_session()
+        try:
+            return session.get(self._data_url, timeout=HTTP_TIMEOUT)
+        except requests.exceptions.ConnectionError:
+            # LibreHardwareMonitor may have closed the idle keep-alive socket - a fresh connection usually works
+            logger.debug("data.json request failed on the pooled connection, retrying once")
+            return session.get(self._data_url, timeout=HTTP_TIMEOUT)
+
     def _try_http_connection(self):
         """Attempt to connect to LibreHardwareMonitor HTTP API"""
         try:
             logger.debug(f"Testing LibreHardwareMonitor HTTP API at {self.http_url}")
             session = self._get_http_session()
-            response = session.get(f"{self.http_url}/data.json", timeout=5)
+            response = session.get(self._data_url, timeout=HTTP_TIMEOUT)
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 if "Children" in data:  # Validate response structure
+                    self._probe_document = data
                     self.use_http = True
                     self.connected = True
                     logger.info(f"🚀 Connected to LibreHardwareMonitor HTTP API at {self.http_url}")
@@ -464,14 +612,21 @@ class HardwareMonitor:
     def _try_wmi_connection(self):
         """Fallback to WMI connection"""
         if not WMI_AVAILABLE:
-            logger.warning("WMI module not available. Install with: pip install wmi pywin32")
+            logger.warning("WMI support not available. Install with: pip install pywin32")
             logger.info("💡 For better performance, enable LibreHardwareMonitor HTTP server in Options")
             self.connected = False
             return
 
         try:
             logger.debug("Attempting WMI connection to LibreHardwareMonitor")
-            self.w = wmi.WMI(namespace="root\\LibreHardwareMonitor")
+            # Initialize COM once for the life of the monitor; the connection
+            # below is then reused by every update instead of re-dispatched
+            self._init_com()
+            # Talk to SWbemServices directly - the wmi package wraps every row
+            # and property access in extra Python-side lookups
+            locator = win32com.client.Dispatch("WbemScripting.SWbemLocator")
+            self.wbem = locator.ConnectServer(".", LHM_WMI_NAMESPACE)
+            self.wbem.Security_.ImpersonationLevel = WBEM_IMPERSONATION_IMPERSONATE
             self.connected = True
             self.use_http = False
             logger.info("⚠️  Connected via WMI fallback (higher CPU usage)")
@@ -481,9 +636,31 @@ class HardwareMonitor:
             logger.warning("LibreHardwareMonitor may not be running or WMI/HTTP may not be enabled")
             logger.info("Monitor will run in demo mode - no metrics will be collected")
             self.connected = False
-            self.w = None
+            self.wbem = None
 
-    def get_sensors(self) -> List:
+    def _init_com(self):
+        """Initialize COM on this thread once, tolerating an existing apartment"""
+        if self._com_initialized:
+            return
+        try:
+            pythoncom.CoInitialize()
+            self._com_initialized = True
+        except pythoncom.com_error as e:
+            # Thread already joined another apartment model - WMI works there too
+            logger.debug(f"COM already initialized on this thread: {e}")
+
+    def close(self):
+        """Release the HTTP session, WMI connection and COM initialization"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        self.wbem = None
+        if self._com_initialized:
+            pythoncom.CoUninitialize()
+            self._com_initialized = False
+        self.connected = False
+
+    def get_sensors(self) -> List[Sensor]:
         """Get all hardware sensors via HTTP API or WMI"""
         if not self.connected:
             return []
@@ -493,33 +670,44 @@ class HardwareMonitor:
         else:
             return self._get_sensors_wmi()
 
-    def _get_sensors_http(self) -> List[Dict]:
+    def _get_sensors_http(self) -> List[Sensor]:
         """Get sensors from LibreHardwareMonitor HTTP API"""
         try:
-            session = self._get_http_session()
-            response = session.get(f"{self.http_url}/data.json")
+            response = self._fetch_data_json()
             if response.status_code == 200:
-                data = response.json()
+                # An idle rig often serves the exact same document twice in a row -
+                # hand back the previous sensor list without parsing it again
+                content = response.content
+                if content == self._last_payload:
+                    logger.debug("data.json unchanged since last update")
+                    return self._last_sensors
+
+                data = json_loads(content)
+                # Diagnostic tree walks below are only worth doing if someone sees the output
+                debug = logger.isEnabledFor(logging.DEBUG)
                 
                 # Debug: Log the structure to understand the HTTP API format
-                logger.debug(f"HTTP API response keys: {list(data.keys()) if isinstance(data, dict) else 'Not a dict'}")
-                if isinstance(data, dict) and "Children" in data:
-                    logger.debug(f"Root has {len(data['Children'])} children")
-                    
-                    # Quick count to see if sensors exist anywhere
-                    total_sensor_count = self._count_sensors_in_tree(data)
-                    logger.debug(f"Total sensors found in JSON tree: {total_sensor_count}")
+                if debug:
+                    logger.debug(f"HTTP API response keys: {list(data.keys()) if isinstance(data, dict) else 'Not a dict'}")
+                    if isinstance(data, dict) and "Children" in data:
+                        logger.debug(f"Root has {len(data['Children'])} children")
+
+                        # Quick count to see if sensors exist anywhere
+                        total_sensor_count = self._count_sensors_in_tree(data)
+                        logger.debug(f"Total sensors found in JSON tree: {total_sensor_count}")
                 
                 sensors = self._extract_sensors_from_json(data)
-                logger.debug(f"Retrieved {len(sensors)} sensors via HTTP API")
+                logger.debug("Retrieved %s sensors via HTTP API", len(sensors))
                 
                 # Debug: If extraction failed but sensors exist, investigate
-                if len(sensors) == 0 and isinstance(data, dict):
+                if debug and len(sensors) == 0 and isinstance(data, dict):
                     logger.debug("No sensors extracted - investigating JSON structure and hierarchy...")
                     # Check for variable hierarchy depths
                     self._analyze_hierarchy_depths(data)
                     self._debug_json_structure(data, depth=0, max_depth=4)
                 
+                self._last_payload = content
+                self._last_sensors = sensors
                 return sensors
             else:
                 logger.error(f"HTTP API error: {response.status_code}")
@@ -528,36 +716,34 @@ class HardwareMonitor:
             logger.error(f"Error fetching sensors via HTTP: {e}")
             return []
     
+    def _iter_tree_nodes(self, node, path="", depth=0, max_depth=None):
+        """Yield (node, path, depth) for each dict node of the JSON tree in document order"""
+        # Iterative walk - children are pushed reversed to keep document order
+        stack = [(node, path, depth)]
+        while stack:
+            node, path, depth = stack.pop()
+            if not isinstance(node, dict) or (max_depth is not None and depth > max_depth):
+                continue
+
+            current_path = f"{path}/{node.get('Text', 'Unknown')}"
+            yield node, current_path, depth
+
+            children = node.get("Children")
+            if isinstance(children, list):
+                stack.extend((child, current_path, depth + 1) for child in reversed(children))
+
     def _count_sensors_in_tree(self, node):
         """Count all sensors in the JSON tree"""
-        count = 0
-        if isinstance(node, dict):
-            # Check if this node is a sensor
-            if "Type" in node and ("RawValue" in node or "Value" in node):
-                count += 1
-            # Check children
-            if "Children" in node and isinstance(node["Children"], list):
-                for child in node["Children"]:
-                    count += self._count_sensors_in_tree(child)
-        return count
+        return sum(1 for node, _, _ in self._iter_tree_nodes(node)
+                   if "Type" in node and ("RawValue" in node or "Value" in node))
     
     def _analyze_hierarchy_depths(self, node, path="", depth=0, max_depth=6):
         """Analyze hierarchy depths to understand LibreHardwareMonitor structure"""
-        if depth > max_depth:
-            return
-            
-        if isinstance(node, dict):
-            current_path = f"{path}/{node.get('Text', 'Unknown')}"
-            
+        for node, current_path, depth in self._iter_tree_nodes(node, path, depth, max_depth):
             # Check if this node has sensors
             direct_sensors = self._count_direct_sensors_at_level(node)
             if direct_sensors > 0:
                 logger.debug(f"Sensors found at depth {depth}: {current_path} ({direct_sensors} sensors)")
-            
-            # Check children
-            if "Children" in node and isinstance(node["Children"], list):
-                for child in node["Children"]:
-                    self._analyze_hierarchy_depths(child, current_path, depth + 1, max_depth)
     
     def _count_direct_sensors_at_level(self, node):
         """Count sensors at current level and immediate children"""
@@ -612,116 +798,130 @@ class HardwareMonitor:
         else:
             logger.debug(f"{indent}Non-dict: {type(node)}")
 
-    def _get_sensors_wmi(self) -> List:
+    def _get_sensors_wmi(self) -> List[Sensor]:
         """Get sensors from WMI (fallback method)"""
-        if not self.w:
+        if not self.wbem:
             return []
         try:
-            sensors = self.w.Sensor()
+            # Forward-only cursor over just the columns we use, read into the same
+            # Sensor tuples as the HTTP API so update_metrics has a single code path
+            sensors = [
+                Sensor(row.SensorType, row.Name, row.Value, row.Parent or '')
+                for row in self.wbem.ExecQuery(
+                    "SELECT SensorType, Name, Value, Parent FROM Sensor", "WQL", WBEM_FLAGS_FAST_QUERY
+                )
+            ]
             logger.debug(f"Retrieved {len(sensors)} sensors via WMI")
             return sensors
         except Exception as e:
             logger.error(f"Error reading WMI sensors: {e}")
             return []
 
-    def _extract_sensors_from_json(self, node, parent_path="") -> List[Dict]:
+    def _extract_sensors_from_json(self, node, parent_path="") -> List[Sensor]:
         """Extract sensors from LibreHardwareMonitor JSON tree"""
         sensors = []
-
-        # Build parent path
-        if "Text" in node and node["Text"]:
-            # Clean text for parent path
-            clean_text = node["Text"].lower().replace(' ', '').replace('#', '')
-            if parent_path:
-                current_path = f"{parent_path}/{clean_text}"
-            else:
-                current_path = f"/{clean_text}"
-        else:
-            current_path = parent_path
-
-        # Check if this node is a sensor - LibreHardwareMonitor HTTP API format
-        is_sensor = False
-        sensor_type = None
-        sensor_value = None
-        sensor_name = node.get("Text", "Unknown")
-
-        # LibreHardwareMonitor HTTP API uses "Type" + "Value" (formatted string)
-        # RawValue is typically "N/A" in HTTP API, so we need to parse Value
-        if "Type" in node and "Value" in node:
-            raw_value = node.get("RawValue")
-            value_str = node.get("Value")
-            
-            if raw_value is not None and raw_value != "N/A" and str(raw_value).lower() != "n/a":
-                # Preferred: Use RawValue if available and not N/A
-                is_sensor = True
-                sensor_type = node["Type"] 
-                sensor_value = raw_value
-                logger.debug(f"Found sensor with RawValue: {sensor_name} = {sensor_value} ({sensor_type}) at {current_path}")
-            elif value_str is not None and value_str != "" and str(value_str).lower() != "n/a":
-                # Fallback: Parse formatted Value string (e.g., "45.2 °C", "1850 RPM")
-                is_sensor = True
-                sensor_type = node["Type"]
-                sensor_value = value_str
-                logger.debug(f"Found sensor with Value string: {sensor_name} = {sensor_value} ({sensor_type}) at {current_path}")
-
-        # If this is a sensor node, add it
-        if is_sensor and sensor_type and sensor_value is not None:
-            # Convert to WMI-like structure for compatibility
-            try:
-                # Handle both numeric and formatted string values
-                if isinstance(sensor_value, (int, float)):
-                    # Direct numeric value (from RawValue)
-                    numeric_value = float(sensor_value)
+        included = self._included_sensors
+        filtered_out = 0
+
+        # Iterative walk - children are pushed reversed to keep document order
+        stack = [(node, parent_path)]
+        pop, push = stack.pop, stack.extend
+        while stack:
+            node, parent_path = pop()
+
+            # Build parent path
+            text = node.get("Text")
+            if text:
+                # Clean text for parent path
+                clean_text = text.lower().replace(' ', '').replace('#', '')
+                if parent_path:
+                    current_path = f"{parent_path}/{clean_text}"
                 else:
-                    # Parse formatted string (from Value field like "45.2 °C", "1850 RPM")
-                    numeric_value = self._parse_sensor_value(str(sensor_value))
-                    
-                # Only add sensors with valid numeric values
-                if numeric_value is not None and numeric_value >= 0:
-                    sensor_data = {
-                        "SensorType": sensor_type,
-                        "Name": sensor_name,
-                        "Value": numeric_value,
-                        "Parent": current_path,
-                        "Min": self._parse_sensor_value(str(node.get("Min", "0"))) or 0.0,
-                        "Max": self._parse_sensor_value(str(node.get("Max", "0"))) or 0.0
-                    }
-                    sensors.append(sensor_data)
-                    logger.debug(f"Added sensor: {sensor_type}/{sensor_name} = {numeric_value} (path: {current_path})")
-                else:
-                    logger.debug(f"Skipped sensor with invalid value: {sensor_name} = {sensor_value} -> {numeric_value}")
-            except (ValueError, TypeError) as e:
-                logger.debug(f"Failed to parse sensor value {sensor_value}: {e}")
+                    current_path = f"/{clean_text}"
+            else:
+                current_path = parent_path
 
-        # Process children recursively
-        if "Children" in node and isinstance(node["Children"], list):
-            for child in node["Children"]:
-                sensors.extend(self._extract_sensors_from_json(child, current_path))
+            # Check if this node is a sensor - LibreHardwareMonitor HTTP API format.
+            # Only sensor nodes carry "Type", so a single lookup rules out hardware/group nodes
+            sensor_type = node.get("Type")
+            sensor_value = None
+
+            # LibreHardwareMonitor HTTP API uses "Type" + "Value" (formatted string)
+            # RawValue is typically "N/A" in HTTP API, so we need to parse Value
+            if sensor_type and "Value" in node:
+                sensor_name = node.get("Text", "Unknown")
 
+                # Sensors excluded by the monitoring mode are dropped before any value parsing
+                if included is not None and (self._get_hardware_component(current_path), sensor_type) not in included:
+                    filtered_out += 1
+                else:
+                    raw_value = node.get("RawValue")
+                    value_str = node["Value"]
+
+                    if raw_value is not None and raw_value != "N/A" and str(raw_value).lower() != "n/a":
+                        # Preferred: Use RawValue if available and not N/A
+                        sensor_value = raw_value
+                        logger.debug("Found sensor with RawValue: %s = %s (%s) at %s", sensor_name, sensor_value, sensor_type, current_path)
+                    elif value_str is not None and value_str != "" and str(value_str).lower() != "n/a":
+                        # Fallback: Parse formatted Value string (e.g., "45.2 °C", "1850 RPM")
+                        sensor_value = value_str
+                        logger.debug("Found sensor with Value string: %s = %s (%s) at %s", sensor_name, sensor_value, sensor_type, current_path)
+
+            # If this is a sensor node, add it
+            if sensor_value is not None:
+                # Convert to WMI-like structure for compatibility
+                try:
+                    # Handles both numeric RawValues and formatted strings ("45.2 °C", "1850 RPM")
+                    numeric_value = self._parse_sensor_value(sensor_value)
+                    
+                    # Only add sensors with valid numeric values
+                    if numeric_value is not None and numeric_value >= 0:
+                        # Min/Max are not exported, so they are not parsed either
+                        sensors.append(Sensor(sensor_type, sensor_name, numeric_value, current_path))
+                        logger.debug("Added sensor: %s/%s = %s (path: %s)", sensor_type, sensor_name, numeric_value, current_path)
+                    else:
+                        logger.debug("Skipped sensor with invalid value: %s = %s -> %s", sensor_name, sensor_value, numeric_value)
+                except (ValueError, TypeError) as e:
+                    logger.debug("Failed to parse sensor value %s: %s", sensor_value, e)
+
+            # Queue children
+            children = node.get("Children")
+            if isinstance(children, list):
+                push((child, current_path) for child in reversed(children))
+
+        self._filtered_out_count = filtered_out
         return sensors
 
-    def _parse_sensor_value(self, value_str: str) -> float:
-        """Parse sensor value from string, handling units and European decimal format"""
-        if not value_str or value_str == "" or str(value_str).lower() in ["n/a", "null", "none"]:
-            return None
+    def _parse_sensor_value(self, value_str) -> Optional[float]:
+        """Parse sensor value from a number or string, handling units and European decimal format"""
+        if isinstance(value_str, (int, float)):
+            # Already numeric (e.g. RawValue) - nothing to parse
+            value = float(value_str)
+            return value if value >= 0 and math.isfinite(value) else None
 
-        # Remove common units and clean up the string
-        cleaned = str(value_str).replace('°C', '').replace('RPM', '').replace('%', '').replace('MHz', '').replace('W', '').replace('GB', '').replace('MB', '').replace('V', '').replace('A', '').strip()
-        
-        # Handle European decimal format (comma as decimal separator)
-        cleaned = cleaned.replace(',', '.')
-        
-        # Remove any remaining non-numeric characters except decimal point and minus
-        import re
-        cleaned = re.sub(r'[^0-9.\-]', '', cleaned)
-        
-        try:
-            value = float(cleaned)
-            return value if value >= 0 else None  # Return None for negative values
-        except (ValueError, TypeError):
-            logger.debug(f"Could not parse sensor value: '{value_str}' -> '{cleaned}'")
+        if not value_str:
+            return None
+        value_str = str(value_str)  # No copy for the usual str
+        if value_str.lower() in _MISSING_VALUES:
             return None
 
+        if _PLAIN_NUMBER_RE.fullmatch(value_str):
+            # Fast path: plain numbers such as a string RawValue ("45.2")
+            value = float(value_str)
+        else:
+            # The number always leads and the unit follows, so match it instead of
+            # stripping every known unit off the string. Anything but a unit after
+            # the number (e.g. "1,234.5") is rejected rather than truncated
+            match = _VALUE_NUMBER_RE.match(_DIGIT_GROUP_SEP_RE.sub('', value_str))
+            if not match:
+                logger.debug("Could not parse sensor value: '%s'", value_str)
+                return None
+            
+            # Handle European decimal format (comma as decimal separator)
+            value = float(match.group(1).replace(',', '.'))
+        # Return None for negative values, and for a digit string too long for a float
+        return value if value >= 0 and math.isfinite(value) else None
+
     def _get_hardware_component(self, parent: str) -> str:
         """Extract the top-level hardware component from a sensor path.
         
@@ -740,6 +940,14 @@ class HardwareMonitor:
           /nvidiageforcertx3070/temperature/gpucore -> 'nvidiageforcertx3070' -> GPU
           /amdryzen75800x/temperature/coremax -> 'amdryzen75800x' -> CPU
         """
+        # Sensor paths are stable between updates - classify each one once
+        component = self._component_cache.get(parent)
+        if component is None:
+            component = self._component_cache[parent] = self._classify_hardware_component(parent)
+        return component
+
+    def _classify_hardware_component(self, parent: str) -> str:
+        """Classify a sensor path by its top-level hardware component (uncached)"""
         if not parent:
             return "unknown"
         
@@ -770,95 +978,121 @@ class HardwareMonitor:
         hw_component = parts[idx]
         
         # Classify based on hardware component name
-        # GPU detection - check first to avoid false matches
-        if any(gpu in hw_component for gpu in ["gpu", "nvidia", "geforce", "radeon", "rtx", "gtx", "quadro", "amd rx"]):
-            return "gpu"
-        
-        # CPU detection
-        if any(cpu in hw_component for cpu in ["cpu", "amdcpu", "intelcpu", "ryzen", "threadripper", "epyc", "xeon", "corei", "processor"]):
-            return "cpu"
+        # GPU and CPU come first - see HARDWARE_COMPONENT_KEYWORDS for the order
+        for component, pattern in _HARDWARE_COMPONENT_PATTERNS[:2]:
+            if pattern.search(hw_component):
+                return component
+
         # Special case: Virtual CPU in VMs (the hardware component is literally "virtual")
         if hw_component == "virtual" or hw_component.startswith("virtualcpu"):
             return "cpu"
-        
-        # Memory detection - includes "Generic Memory" -> "genericmemory"
-        if any(mem in hw_component for mem in ["memory", "ram", "genericmemory"]):
-            return "memory"
-        
-        # Motherboard detection
-        if any(mb in hw_component for mb in ["motherboard", "mainboard", "asrock", "asus", "msi", "gigabyte", "nuvoton", "nct", "lpc"]):
-            return "motherboard"
-        
-        # Storage detection
-        if any(drive in hw_component for drive in ["ssd", "hdd", "nvme", "samsung", "wdc", "seagate", "toshiba", "storage", "disk"]):
-            return "storage"
-        
-        # Network detection
-        if any(net in hw_component for net in ["ethernet", "network", "nic", "bluetooth", "wifi", "tailscale"]):
-            return "network"
-        
-        return "other"
 
-    def _is_cpu_sensor(self, parent: str) -> bool:
-        """Check if sensor belongs to CPU based on top-level hardware component"""
-        return self._get_hardware_component(parent) == "cpu"
+        for component, pattern in _HARDWARE_COMPONENT_PATTERNS[2:]:
+            if pattern.search(hw_component):
+                return component
+
+        return "other"
 
-    def update_metrics(self):
-        """Update all Prometheus metrics"""
+    def update_metrics(self) -> Optional[bool]:
+        """Update all Prometheus metrics, returning whether any exported value changed (None if no sensors were read)"""
         sensors = self.get_sensors()
 
         if not sensors:
             logger.warning("No sensors found - is LibreHardwareMonitor running with HTTP server or WMI enabled?")
-            return
+            return None
+
+        # Same sensor list as the published snapshot (unchanged data.json) - nothing to do
+        if sensors is self._published_sensors:
+            return False
 
         logger.debug(f"Processing {len(sensors)} sensors ({('HTTP API' if self.use_http else 'WMI')})")
         
-        # Count sensors by filtering
-        if self.sensor_mode != 'diagnostic':
-            filtered_count = 0
-            total_count = len(sensors)
-            for sensor in sensors:
-                if isinstance(sensor, dict):
-                    sensor_type = sensor.get('SensorType', '')
-                    parent = sensor.get('Parent', '')
-                else:
-                    sensor_type = getattr(sensor, 'SensorType', '')
-                    parent = getattr(sensor, 'Parent', '') or ''
-                
-                # Quick component type detection for filtering (uses top-level hardware component)
-                component_type = self._get_hardware_component(parent)
-                
-                if should_include_sensor(sensor_type, component_type, self.sensor_mode):
-                    filtered_count += 1
-            
-            logger.info(f"📊 Monitoring {filtered_count}/{total_count} sensors (mode: {self.sensor_mode})")
-        
-        # Debug: Log sensor types for troubleshooting
-        if logger.isEnabledFor(logging.DEBUG):
-            sensor_types = {}
+        # Debug: Tally sensor types for troubleshooting in the main loop below
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            sensor_types = Counter()
             critical_metrics = []
             gpu_sensors_by_type = defaultdict(list)  # Track GPU sensors by type
-            
-            for sensor in sensors:
-                if isinstance(sensor, dict):
-                    stype = sensor.get('SensorType', 'Unknown')
-                    sname = sensor.get('Name', 'Unknown')
-                    parent = sensor.get('Parent', 'Unknown')
-                else:
-                    stype = getattr(sensor, 'SensorType', 'Unknown')
-                    sname = getattr(sensor, 'Name', 'Unknown')
-                    parent = getattr(sensor, 'Parent', 'Unknown')
-                    
-                sensor_types[stype] = sensor_types.get(stype, 0) + 1
+
+        samples = {}
+        monitored_count = 0  # Counted in the main loop - no separate filtering pass
+        # HTTP API and WMI sensors both arrive as Sensor tuples
+        for sensor_type, sensor_name, raw_value, parent in sensors:
+            # Debug breakdown counts every sensor, including the ones skipped below
+            if debug:
+                sensor_types[sensor_type] += 1
                 
                 # Track GPU sensors specifically
-                if 'gpu' in parent.lower() or 'geforce' in parent.lower() or 'nvidia' in parent.lower():
-                    gpu_sensors_by_type[stype].append(sname)
+                if _GPU_PARENT_RE.search(parent.lower()):
+                    gpu_sensors_by_type[sensor_type].append(sensor_name)
                 
                 # Track critical metrics that user specifically mentioned
-                if any(metric in sname for metric in ['GPU Memory Free', 'GPU Memory Used', 'GPU Memory Total', 'GPU Core', 'Package']):
-                    critical_metrics.append(f"{stype}/{sname}")
+                if sensor_name and _CRITICAL_SENSOR_NAME_RE.search(sensor_name):
+                    critical_metrics.append(f"{sensor_type}/{sensor_name}")
+
+            # Skip sensors with no name or a null type - allow 0 values as they're valid
+            if not sensor_name or sensor_type is None:
+                continue
+
+            # Validate the value up front instead of catching errors per sensor.
+            # Fix: properly handle 0 values - only None counts as missing (exported as 0)
+            if raw_value is None:
+                value = 0.0
+            elif isinstance(raw_value, (int, float)):
+                value = float(raw_value)
+            else:
+                try:
+                    value = float(raw_value)
+                except (TypeError, ValueError):
+                    logger.debug("Skipping sensor %s with non-numeric value %r", sensor_name, raw_value)
+                    continue
+            
+            # Only skip clearly invalid negative values for certain sensor types
+            if value < 0 and sensor_type in NON_NEGATIVE_SENSOR_TYPES:
+                continue
             
+            # Sensor identity is stable between updates, so the name mapping,
+            # filter decision and help text are resolved once per sensor and cached
+            route_key = (sensor_type, sensor_name, parent)
+            route = self._route_cache.get(route_key)
+            if route is None:
+                try:
+                    # Determine component type using top-level hardware component extraction
+                    # This prevents false matches like "virtualmemory" matching the "/virtual" CPU pattern
+                    component_type = self._get_hardware_component(parent)
+
+                    # Get standardized metric name
+                    standardized_name = get_standardized_metric_name(sensor_name, component_type, sensor_type.lower())
+                except Exception as e:
+                    # One odd row must not take down the whole update - skip it like before
+                    logger.debug(f"Error processing sensor {sensor_name}: {e}")
+                    continue
+
+                # Apply sensor filtering based on mode - skipped sensors get no help text
+                if self._included_sensors is not None and (component_type, sensor_type) not in self._included_sensors:
+                    help_text = None
+                elif not METRIC_NAME_RE.match(f"rigbeat_{standardized_name}"):
+                    logger.warning(f"Skipping sensor {sensor_type}/{sensor_name}: invalid metric name rigbeat_{standardized_name}")
+                    help_text = None
+                else:
+                    help_text = get_metric_help_text(sensor_type)
+                route = self._route_cache[route_key] = SensorRoute(standardized_name, help_text)
+
+            standardized_name = route.metric_name
+            help_text = route.help_text
+            if help_text is None:
+                logger.debug("Filtered out sensor: %s/%s (mode: %s)", sensor_type, sensor_name, self.sensor_mode)
+                continue
+            
+            logger.debug("Processing sensor: %s/%s = %s (parent: %s) -> %s", sensor_type, sensor_name, value, parent, standardized_name)
+
+            # Pass through raw values - let Grafana handle unit conversions
+            # SmallData = MB, Data = GB (as reported by LibreHardwareMonitor)
+            samples[standardized_name] = (help_text, value)
+            monitored_count += 1
+            logger.debug("✅ Set metric %s: %s", standardized_name, value)
+
+        if debug:
             logger.debug(f"Sensor types found: {dict(sensor_types)}")
             
             # Show GPU sensors breakdown for troubleshooting
@@ -870,79 +1104,45 @@ class HardwareMonitor:
             if critical_metrics:
                 logger.debug(f"Critical sensors found: {critical_metrics}")
 
-        for sensor in sensors:
-            try:
-                # Handle both HTTP API dict structure and WMI object structure
-                if isinstance(sensor, dict):
-                    # HTTP API response structure
-                    sensor_type = sensor.get('SensorType', '')
-                    sensor_name = sensor.get('Name', '')
-                    value = float(sensor.get('Value', 0)) if sensor.get('Value') is not None else 0
-                    parent = sensor.get('Parent', '')
-                else:
-                    # WMI object structure
-                    sensor_type = getattr(sensor, 'SensorType', '')
-                    sensor_name = getattr(sensor, 'Name', '')
-                    # Fix: properly handle 0 values - only skip None/empty values
-                    raw_value = getattr(sensor, 'Value', None)
-                    value = float(raw_value) if raw_value is not None else 0
-                    parent = getattr(sensor, 'Parent', '') or ''
-
-                # Skip sensors with no name - allow 0 values as they're valid
-                if not sensor_name:
-                    continue
-                
-                # Only skip clearly invalid negative values for certain sensor types
-                if value < 0 and sensor_type in ["Temperature", "Load", "Clock", "Power", "Fan"]:
-                    continue
-                
-                # Determine component type using top-level hardware component extraction
-                # This prevents false matches like "virtualmemory" matching the "/virtual" CPU pattern
-                component_type = self._get_hardware_component(parent)
-                    
-                # Get standardized metric name
-                standardized_name = get_standardized_metric_name(sensor_name, component_type, sensor_type.lower())
-                
-                # Apply sensor filtering based on mode
-                if not should_include_sensor(sensor_type, component_type, self.sensor_mode):
-                    logger.debug(f"Filtered out sensor: {sensor_type}/{sensor_name} (mode: {self.sensor_mode})")
-                    continue
-                
-                logger.debug(f"Processing sensor: {sensor_type}/{sensor_name} = {value} (parent: {parent}) -> {standardized_name}")
-
-                # Create metric dynamically and set value
-                metric = get_or_create_metric(standardized_name, sensor_type)
-                
-                # Set metric value directly (no labels needed - metric name is descriptive)
-                try:
-                    # Pass through raw values - let Grafana handle unit conversions
-                    # SmallData = MB, Data = GB (as reported by LibreHardwareMonitor)
-                    metric.set(value)
-                    logger.debug(f"✅ Set metric {standardized_name}: {value}")
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to set metric {standardized_name}: {e}")
+        if self.sensor_mode != 'diagnostic':
+            # HTTP sensors excluded by the mode were already dropped while walking data.json
+            total_count = len(sensors) + (self._filtered_out_count if self.use_http else 0)
+            logger.info(f"📊 Monitoring {monitored_count}/{total_count} sensors (mode: {self.sensor_mode})")
 
-            except Exception as e:
-                logger.debug(f"Error processing sensor {sensor_name if 'sensor_name' in locals() else 'unknown'}: {e}")
-                continue
+        # Publish the whole update at once - scrapes never see a half-written set
+        self._published_sensors = sensors
+        return sensor_collector.update(samples)
 
     def get_system_info(self) -> Dict:
-        """Get system information via HTTP API or WMI"""
+        """Get system information via HTTP API or WMI (detected once, then cached)"""
         if not self.connected:
             return {'cpu': 'Demo CPU', 'gpu': 'Demo GPU', 'motherboard': 'Demo Board'}
 
+        if self._system_info is not None:
+            return dict(self._system_info)
+
         if self.use_http:
-            return self._get_system_info_http()
+            info = self._get_system_info_http()
         else:
-            return self._get_system_info_wmi()
+            info = self._get_system_info_wmi()
+
+        # Hardware doesn't change while we run - but keep retrying if nothing was detected
+        if any(value != 'Unknown' for value in info.values()):
+            self._system_info = info
+        return dict(info)
 
     def _get_system_info_http(self) -> Dict:
         """Get system info from HTTP API"""
+        # The connection probe fetched the same document moments ago - use it once,
+        # then drop it so the parsed tree isn't kept for the life of the process
+        data, self._probe_document = self._probe_document, None
         try:
-            response = requests.get(f"{self.http_url}/data.json", timeout=10)
+            if data is not None:
+                return self._extract_system_info_from_json(data)
+
+            response = self._fetch_data_json()
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 return self._extract_system_info_from_json(data)
             else:
                 return {'cpu': 'Unknown', 'gpu': 'Unknown', 'motherboard': 'Unknown'}
@@ -952,11 +1152,12 @@ class HardwareMonitor:
 
     def _get_system_info_wmi(self) -> Dict:
         """Get system info from WMI (fallback)"""
-        if not self.w:
+        if not self.wbem:
             return {'cpu': 'Demo CPU', 'gpu': 'Demo GPU', 'motherboard': 'Demo Board'}
 
         try:
-            hardware = self.w.Hardware()
+            # Only the two columns the detection below reads cross the DCOM boundary
+            hardware = self.wbem.ExecQuery("SELECT HardwareType, Name FROM Hardware", "WQL", WBEM_FLAGS_FAST_QUERY)
             info = {
                 'cpu': 'Unknown',
                 'gpu': 'Unknown', 
@@ -970,7 +1171,7 @@ class HardwareMonitor:
                 if not hw_type:  # Skip if no hardware type
                     continue
 
-                logger.debug(f"Found hardware: Type={hw_type}, Name={hw_name}")
+                logger.debug("Found hardware: Type=%s, Name=%s", hw_type, hw_name)
 
                 if hw_type.lower() in ["cpu", "processor"] or "cpu" in hw_type.lower() or "processor" in hw_type.lower():
                     info['cpu'] = hw_name
@@ -991,34 +1192,45 @@ class HardwareMonitor:
         """Extract hardware info from JSON data"""
         info = {'cpu': 'Unknown', 'gpu': 'Unknown', 'motherboard': 'Unknown'}
 
-        def search_hardware_node(node):
-            if "Text" in node and node["Text"]:
-                text = node["Text"]
-                text_lower = text.lower()
-
-                # CPU detection
-                if any(x in text_lower for x in ["intel", "amd", "ryzen", "core i", "threadripper", "epyc"]):
-                    if not any(x in text_lower for x in ["gpu", "graphics", "radeon rx", "geforce"]):
-                        info['cpu'] = text
-                        logger.debug(f"Detected CPU: {text}")
-
-                # GPU detection
-                elif any(x in text_lower for x in ["nvidia", "geforce", "quadro", "rtx", "gtx", "radeon", "rx "]):
-                    info['gpu'] = text 
-                    logger.debug(f"Detected GPU: {text}")
-
-                # Motherboard detection
-                elif any(x in text_lower for x in ["motherboard", "mainboard", "asus", "msi", "gigabyte", "asrock", "evga"]):
-                    if "gpu" not in text_lower:  # Avoid GPU manufacturers
-                        info['motherboard'] = text
-                        logger.debug(f"Detected Motherboard: {text}")
-
-            # Search children
-            if "Children" in node and isinstance(node["Children"], list):
-                for child in node["Children"]:
-                    search_hardware_node(child)
+        # The last matching node in document order wins, so walk the tree in reverse
+        # preorder (children last-to-first, then the node) and keep the first match per
+        # field - that allows stopping as soon as all three fields are known
+        stack = [(data, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if not children_done:
+                stack.append((node, True))
+                children = node.get("Children")
+                if isinstance(children, list):
+                    stack.extend((child, False) for child in children)
+                continue
+
+            text = node.get("Text")
+            if not text:
+                continue
+            text_lower = text.lower()
+
+            # CPU detection
+            if any(x in text_lower for x in _CPU_NAME_KEYWORDS):
+                if info['cpu'] == 'Unknown' and not any(x in text_lower for x in _CPU_NAME_EXCLUDES):
+                    info['cpu'] = text
+                    logger.debug("Detected CPU: %s", text)
+
+            # GPU detection
+            elif any(x in text_lower for x in _GPU_NAME_KEYWORDS):
+                if info['gpu'] == 'Unknown':
+                    info['gpu'] = text
+                    logger.debug("Detected GPU: %s", text)
+
+            # Motherboard detection
+            elif any(x in text_lower for x in _MOTHERBOARD_NAME_KEYWORDS):
+                if info['motherboard'] == 'Unknown' and "gpu" not in text_lower:  # Avoid GPU manufacturers
+                    info['motherboard'] = text
+                    logger.debug("Detected Motherboard: %s", text)
+
+            if 'Unknown' not in info.values():
+                break
 
-        search_hardware_node(data)
         return info
 
 
@@ -1026,6 +1238,7 @@ def main():
     parser = argparse.ArgumentParser(description='Rigbeat - Prometheus Exporter')
     parser.add_argument('--port', type=int, default=9182, help='Port to expose metrics (default: 9182)')
     parser.add_argument('--interval', type=int, default=2, help='Update interval in seconds (default: 2, use 2-5 for real-time gaming or 10+ for general monitoring)')
+    parser.add_argument('--max-interval', type=int, help='Back off polling up to this many seconds while sensor readings are unchanged (default: disabled)')
     parser.add_argument('--logfile', type=str, help='Log file path (e.g., rigbeat.log)')
     parser.add_argument('--debug', action='store_true', help='Enable debug logging')
     parser.add_argument('--http-host', type=str, default='localhost', help='LibreHardwareMonitor HTTP API host (default: localhost)')
@@ -1048,11 +1261,15 @@ def main():
 
     logger.info(f"Starting Rigbeat Exporter v0.1.3 on port {args.port}")
     logger.info(f"Update interval: {args.interval} seconds")
+    # Adaptive polling is opt-in: without --max-interval the interval never grows
+    max_interval = max(args.max_interval or args.interval, args.interval)
+    if max_interval > args.interval:
+        logger.info(f"Adaptive polling: backing off up to {max_interval} seconds while readings are unchanged")
     logger.info(f"Sensor mode: {args.sensor_mode}")
 
     if args.debug:
         logger.debug(f"LibreHardwareMonitor HTTP API target: {args.http_host}:{args.http_port}")
-        logger.debug(f"WMI fallback: {'Available' if WMI_AVAILABLE else 'Not available (install with: pip install wmi pywin32)'}")
+        logger.debug(f"WMI fallback: {'Available' if WMI_AVAILABLE else 'Not available (install with: pip install pywin32)'}")
 
     # Initialize monitor
     try:
@@ -1068,6 +1285,11 @@ def main():
         logger.error(f"Failed to initialize hardware monitor: {e}")
         return 1
 
+    # Start Prometheus HTTP server before the (possibly slow) hardware detection,
+    # so /metrics answers right away - rigbeat_system_info appears once detected
+    start_http_server(args.port)
+    logger.info(f"Metrics available at http://localhost:{args.port}/metrics")
+
     # Get and set system info
     sys_info = monitor.get_system_info()
     system_info.info(sys_info)
@@ -1079,10 +1301,6 @@ def main():
         logger.info("⚠️  Using WMI fallback (higher CPU usage)")
         logger.info("💡 Enable HTTP server in LibreHardwareMonitor for better performance")
 
-    # Start Prometheus HTTP server
-    start_http_server(args.port)
-    logger.info(f"Metrics available at http://localhost:{args.port}/metrics")
-
     # Windows Firewall reminder
     if args.port != 9182:
         logger.warning(f"Using non-default port {args.port} - ensure Windows Firewall allows this port")
@@ -1092,21 +1310,48 @@ def main():
     # Main loop
     try:
         logger.info("Starting metrics collection loop...")
+        interval = args.interval
+        # Sleep until a deadline rather than for a fixed time, so slow updates
+        # don't push every following update later
+        next_deadline = time.monotonic()
+        overrunning = False  # Warn when updates start overrunning, not on every cycle
         while True:
-            start_time = time.time()
-            monitor.update_metrics()
-            update_duration = time.time() - start_time
+            start_time = time.monotonic()
+            changed = monitor.update_metrics()
+            update_duration = time.monotonic() - start_time
 
             if args.debug:
                 logger.debug(f"Metrics update completed in {update_duration:.3f}s")
 
-            time.sleep(args.interval)
+            # Idle rigs report the same readings for long stretches - double the
+            # interval while a successful poll changes nothing and drop back as soon
+            # as something does. A failed poll (None) keeps the base interval so
+            # recovery isn't delayed while LibreHardwareMonitor is down
+            interval = min(interval * 2, max_interval) if changed is False else args.interval
+
+            next_deadline += interval
+            sleep_for = next_deadline - time.monotonic()
+            if sleep_for > 0:
+                if overrunning:
+                    logger.info("Metrics updates are back within the interval")
+                    overrunning = False
+                time.sleep(sleep_for)
+            else:
+                # Overran the interval - start the next update now and reschedule from here
+                if overrunning:
+                    logger.debug(f"Metrics update overran the interval by {-sleep_for:.2f}s")
+                else:
+                    logger.warning(f"Metrics update overran the interval by {-sleep_for:.2f}s (further overruns are logged at debug level)")
+                    overrunning = True
+                next_deadline = time.monotonic()
     except KeyboardInterrupt:
         logger.info("Shutting down...")
         return 0
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
         return 1
+    finally:
+        monitor.close()
 
 
 if __name__ == '__main__':
@@ -25,15 +25,19 @@ Examples:
     python3 sensor_discovery.py --method wmi             # Force WMI only
     python3 sensor_discovery.py --host 192.168.1.100     # Remote system
     python3 sensor_discovery.py --port 8080              # Custom port
+    python3 sensor_discovery.py --debug                  # Show parent path mapping
 
 Requirements:
 - LibreHardwareMonitor running with HTTP server enabled (preferred) or WMI enabled (fallback)
 - Python 3.6+ with 'requests' package
 - For WMI fallback: pip install pywin32
+- Optional: pip install orjson (faster parsing of large data.json responses)
 """
 
 import requests
+import io
 import json
+import re
 import sys
 import argparse
 from collections import defaultdict
@@ -46,7 +50,33 @@ except ImportError:
     WMI_AVAILABLE = False
     wmi = None
 
-def test_connection_methods(host="localhost", port=8085, method="auto"):
+# Try to import orjson for faster JSON parsing (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Everything but digits, decimal point and sign - units like °C/RPM/MHz go too
+_VALUE_CLEAN_RE = re.compile(r'[^0-9.\-]')
+
+
+def clean_sensor_value(value) -> str:
+    """Strip units from a formatted sensor value (e.g. "45,2 °C" -> "45.2")"""
+    # Comma first: LibreHardwareMonitor uses the locale's decimal separator
+    return _VALUE_CLEAN_RE.sub('', str(value).replace(',', '.'))
+
+
+def numeric_raw_value(node):
+    """Return RawValue as a float when LHM already sent it as a number, else None"""
+    raw_value = node.get("RawValue")
+    if isinstance(raw_value, (int, float)):
+        return float(raw_value)
+    return None
+
+
+def test_connection_methods(host="localhost", port=8085, method="auto", debug=False):
     """Test both HTTP API and WMI methods for LibreHardwareMonitor"""
     
     print(f"🔍 Rigbeat Sensor Discovery Tool v0.1.3")
@@ -104,7 +134,7 @@ def test_connection_methods(host="localhost", port=8085, method="auto"):
     
     # Analyze sensors using existing analysis function
     print(f"📊 Analyzing {len(sensors)} sensors via {connection_method.upper()}...")
-    analyze_sensors_simple(sensors, connection_method)
+    analyze_sensors_simple(sensors, connection_method, debug)
 
 
 def get_hardware_component(parent: str) -> str:
@@ -187,15 +217,19 @@ def get_hardware_component(parent: str) -> str:
     return "Other"
 
 
-def analyze_sensors_simple(sensors, connection_method):
+def analyze_sensors_simple(sensors, connection_method, debug=False):
     """Simple sensor analysis for both HTTP and WMI data"""
+
+    # The report runs to hundreds of lines - build it in memory and write it
+    # out once instead of paying console I/O per print (slow on Windows)
+    out = io.StringIO()
     
     # Group sensors by type and component
     sensor_types = defaultdict(int)
     components = defaultdict(lambda: defaultdict(list))  # component -> sensor_type -> [sensors]
     critical_sensors = []
     
-    # DEBUG: Track unique parent paths and their detected components
+    # DEBUG: Track unique parent paths and their detected components (--debug only)
     parent_to_component = {}
     
     for sensor in sensors:
@@ -214,7 +248,7 @@ def analyze_sensors_simple(sensors, connection_method):
         component = get_hardware_component(parent)
         
         # DEBUG: Track path -> component mapping
-        if parent not in parent_to_component:
+        if debug and parent not in parent_to_component:
             parent_to_component[parent] = component
         
         # Store sensor details by component and type
@@ -229,43 +263,44 @@ def analyze_sensors_simple(sensors, connection_method):
             critical_sensors.append(f"{sensor_type}/{sensor_name} = {sensor_value}")
     
     # Display results
-    print("=" * 80)
-    print("📊 SENSOR ANALYSIS SUMMARY")
-    print("=" * 80)
-    print(f"Connection Method: {connection_method.upper()}")
-    print(f"Total Sensors: {len(sensors)}")
-    print()
+    print("=" * 80, file=out)
+    print("📊 SENSOR ANALYSIS SUMMARY", file=out)
+    print("=" * 80, file=out)
+    print(f"Connection Method: {connection_method.upper()}", file=out)
+    print(f"Total Sensors: {len(sensors)}", file=out)
+    print(file=out)
     
     # DEBUG: Show parent path to component mapping
-    print("🔍 DEBUG: Parent Path → Component Mapping:")
-    for path, comp in sorted(parent_to_component.items()):
-        # Extract first segment for clarity
-        parts = [p for p in path.lower().split('/') if p and p != 'computer']
-        hw_segment = parts[0] if parts else "(empty)"
-        print(f"  {path}")
-        print(f"    → hw_segment: '{hw_segment}' → Component: {comp}")
-    print()
-    
-    print("🔧 Sensor Types Overview:")
+    if debug:
+        print("🔍 DEBUG: Parent Path → Component Mapping:", file=out)
+        for path, comp in sorted(parent_to_component.items()):
+            # Extract first segment for clarity
+            parts = [p for p in path.lower().split('/') if p and p != 'computer']
+            hw_segment = parts[0] if parts else "(empty)"
+            print(f"  {path}", file=out)
+            print(f"    → hw_segment: '{hw_segment}' → Component: {comp}", file=out)
+        print(file=out)
+    
+    print("🔧 Sensor Types Overview:", file=out)
     for stype, count in sorted(sensor_types.items()):
-        print(f"  {stype}: {count}")
-    print()
+        print(f"  {stype}: {count}", file=out)
+    print(file=out)
     
-    print("=" * 80)
-    print("💻 DETAILED COMPONENT BREAKDOWN")
-    print("=" * 80)
+    print("=" * 80, file=out)
+    print("💻 DETAILED COMPONENT BREAKDOWN", file=out)
+    print("=" * 80, file=out)
     
     for component in sorted(components.keys()):
-        print()
-        print(f"{'─' * 80}")
-        print(f"🔹 {component.upper()}")
-        print(f"{'─' * 80}")
+        print(file=out)
+        print(f"{'─' * 80}", file=out)
+        print(f"🔹 {component.upper()}", file=out)
+        print(f"{'─' * 80}", file=out)
         
         component_sensors = components[component]
         for sensor_type in sorted(component_sensors.keys()):
             sensor_list = component_sensors[sensor_type]
-            print(f"\n  📂 {sensor_type} ({len(sensor_list)} sensors):")
-            print(f"  {'─' * 76}")
+            print(f"\n  📂 {sensor_type} ({len(sensor_list)} sensors):", file=out)
+            print(f"  {'─' * 76}", file=out)
             
             # Show all sensors in a table format
             for idx, s in enumerate(sensor_list, 1):
@@ -306,25 +341,27 @@ def analyze_sensors_simple(sensors, connection_method):
                 # Truncate long names
                 display_name = s['name'][:45] + '...' if len(s['name']) > 48 else s['name']
                 
-                print(f"    {idx:2}. {display_name:<48} {value_str:>12}")
+                print(f"    {idx:2}. {display_name:<48} {value_str:>12}", file=out)
     
-    print()
-    print("=" * 80)
+    print(file=out)
+    print("=" * 80, file=out)
     
     if critical_sensors:
-        print()
-        print("🎯 Critical Sensors Found:")
+        print(file=out)
+        print("🎯 Critical Sensors Found:", file=out)
         for sensor in critical_sensors[:15]:  # Show first 15
-            print(f"  ✓ {sensor}")
+            print(f"  ✓ {sensor}", file=out)
         if len(critical_sensors) > 15:
-            print(f"  ... and {len(critical_sensors) - 15} more")
+            print(f"  ... and {len(critical_sensors) - 15} more", file=out)
     
-    print()
-    print("💡 Next Steps:")
-    print("  1. Run 'python hardware_exporter.py --debug' to see detailed sensor processing")
-    print("  2. Check http://localhost:9182/metrics for live Prometheus metrics")
+    print(file=out)
+    print("💡 Next Steps:", file=out)
+    print("  1. Run 'python hardware_exporter.py --debug' to see detailed sensor processing", file=out)
+    print("  2. Check http://localhost:9182/metrics for live Prometheus metrics", file=out)
     if connection_method == "wmi":
-        print("  3. Consider enabling HTTP server for better performance")
+        print("  3. Consider enabling HTTP server for better performance", file=out)
+
+    sys.stdout.write(out.getvalue())
 
 
 def test_wmi_api():
@@ -361,8 +398,15 @@ def test_http_api(host="localhost", port=8085):
     try:
         response = requests.get(url, timeout=10)
         if response.status_code == 200:
-            data = response.json()
-            print(f"📊 HTTP API Response: {len(response.text)} characters")
+            # Parse the raw bytes directly - skips the intermediate text decode
+            content = response.content
+            data = orjson.loads(content) if ORJSON_AVAILABLE else json.loads(content)
+            print(f"📊 HTTP API Response: {len(content)} bytes")
+
+            # Validate the root once - the tree walkers trust the node schema below it
+            if not isinstance(data, dict):
+                print(f"Unexpected data.json root: {type(data).__name__}")
+                return []
             
             # Extract sensors from JSON structure
             sensors = extract_sensors_from_json(data)
@@ -384,290 +428,57 @@ def extract_sensors_from_json(node, parent_path=""):
     """Extract sensors from LibreHardwareMonitor JSON tree"""
     sensors = []
 
-    # Build parent path
-    if "Text" in node and node["Text"]:
-        clean_text = node["Text"].lower().replace(' ', '').replace('#', '')
-        if parent_path:
-            current_path = f"{parent_path}/{clean_text}"
-        else:
-            current_path = f"/{clean_text}"
-    else:
-        current_path = parent_path
-
-    # Check if this node is a sensor
-    if "Type" in node and "Value" in node:
-        sensor_name = node.get("Text", "Unknown")
-        sensor_type = node.get("Type")
-        value_str = node.get("Value", "")
-        
-        # Parse value
-        try:
-            if isinstance(value_str, (int, float)):
-                numeric_value = float(value_str)
+    # Iterative walk - children are pushed reversed to keep document order
+    stack = [(node, parent_path)]
+    pop, push = stack.pop, stack.extend
+    while stack:
+        node, parent_path = pop()
+
+        # Build parent path
+        text = node.get("Text")
+        if text:
+            clean_text = text.lower().replace(' ', '').replace('#', '')
+            if parent_path:
+                current_path = f"{parent_path}/{clean_text}"
             else:
-                # Parse formatted string (e.g., "45.2 °C", "1850 RPM")
-                cleaned = str(value_str).replace('°C', '').replace('RPM', '').replace('%', '').replace('MHz', '').replace('W', '').strip()
-                cleaned = cleaned.replace(',', '.')
-                import re
-                cleaned = re.sub(r'[^0-9.\-]', '', cleaned)
-                numeric_value = float(cleaned) if cleaned else 0
-        except:
-            numeric_value = 0
-        
-        if numeric_value >= 0:  # Only include valid values
-            sensor_data = {
-                "SensorType": sensor_type,
-                "Name": sensor_name,
-                "Value": numeric_value,
-                "Parent": current_path
-            }
-            sensors.append(sensor_data)
-
-    # Process children recursively
-    if "Children" in node and isinstance(node["Children"], list):
-        for child in node["Children"]:
-            sensors.extend(extract_sensors_from_json(child, current_path))
-
-    return sensors
-
-
-def count_direct_sensors(node):
-    """Count sensors directly at this level (not in children)"""
-    if not isinstance(node, dict):
-        return 0
-
-    count = 0
-    # Check if this node itself is a sensor
-    if "Type" in node and ("RawValue" in node or "Value" in node):
-        count += 1
-
-    # Check immediate children only (not recursive)
-    if "Children" in node and isinstance(node["Children"], list):
-        for child in node["Children"]:
-            if isinstance(child, dict) and "Type" in child and ("RawValue" in child or "Value" in child):
-                count += 1
-
-    return count
-
-
-def count_direct_sensors(node):
-    """Count sensors directly at this level (not in children)"""
-    if not isinstance(node, dict):
-        return 0
-
-    count = 0
-    # Check if this node itself is a sensor
-    if "Type" in node and ("RawValue" in node or "Value" in node):
-        count += 1
-
-    # Check immediate children only (not recursive)
-    if "Children" in node and isinstance(node["Children"], list):
-        for child in node["Children"]:
-            if isinstance(child, dict) and "Type" in child and ("RawValue" in child or "Value" in child):
-                count += 1
-
-    return count
-
-
-def find_and_show_sensors(node, depth=0, max_sensors=5, sensors_found=0):
-    """Find and show sensors in a node and its children"""
-
-    if sensors_found >= max_sensors:
-        return sensors_found
-
-    if isinstance(node, dict):
-        # Check if this node is a sensor - must have Type and valid Value
-        if "Type" in node and "Value" in node:
-            value = node.get("Value")
-            if value is not None and str(value).strip() and str(value).lower() not in ["n/a", "", "null"]:
-                if sensors_found < max_sensors:
-                    sensor_name = node.get("Text", "Unknown")
-                    sensor_type = node.get("Type", "Unknown")
-                    raw_value = node.get("RawValue", "N/A")
-                    value = node.get("Value", "N/A")
-                    indent = "       " + "  " * depth
-                    print(f"{indent}🌡️  {sensor_type}: {sensor_name}")
-                    print(f"{indent}     RawValue: {raw_value}, Value: {value}")
-
-                    # Show what the parsed value would be
-                    if value and str(value) not in ["N/A", "n/a", ""]:
-                        try:
-                            # Parse like the main script does
-                            cleaned = str(value).replace(',', '.').replace('°C', '').replace('RPM', '').replace('%', '').replace('MHz', '').replace('W', '').replace('V', '').replace('A', '').strip()
-                            import re
-                            cleaned = re.sub(r'[^0-9.\\-]', '', cleaned)
-                            if cleaned:
-                                parsed = float(cleaned)
-                                print(f"{indent}     Parsed: {parsed}")
-                        except:
-                            pass
-                sensors_found += 1
-
-        # Check children recursively (look deeper!)
-        if "Children" in node and isinstance(node["Children"], list):
-            for child in node["Children"]:
-                sensors_found = find_and_show_sensors(child, depth + 1, max_sensors, sensors_found)
-                if sensors_found >= max_sensors:
-                    break
-
-    return sensors_found
-
-
-def find_sensor_locations(node, path="", max_examples=10, examples_found=0):
-    """Find where sensors are located in the tree"""
-    if examples_found >= max_examples:
-        return examples_found
-
-    if isinstance(node, dict):
-        current_path = f"{path}/{node.get('Text', 'Unknown')}" if node.get('Text') else path
+                current_path = f"/{clean_text}"
+        else:
+            current_path = parent_path
 
         # Check if this node is a sensor
-        if "Type" in node and ("RawValue" in node or "Value" in node):
-            if examples_found < max_examples:
-                sensor_name = node.get("Text", "Unknown") 
-                sensor_type = node.get("Type", "Unknown")
-                raw_value = node.get("RawValue", "N/A")
-                value_str = node.get("Value", "N/A")
-                print(f"  📍 {current_path}")
-                print(f"     Type: {sensor_type}, Name: {sensor_name}")
-                print(f"     RawValue: {raw_value}, Value: {value_str}")
-
-                # Show parsing result for Value field
-                if value_str and value_str != "N/A":
-                    try:
-                        # Simple parsing simulation
-                        cleaned = str(value_str).replace(',', '.').replace('°C', '').replace('RPM', '').replace('%', '').replace('MHz', '').replace('W', '').replace('GB', '').replace('MB', '').replace('V', '').replace('A', '').strip()
-                        import re
-                        cleaned = re.sub(r'[^0-9.\\-]', '', cleaned)
-                        if cleaned:
-                            parsed_value = float(cleaned)
-                            print(f"     Parsed: {parsed_value}")
-                    except:
-                        print(f"     Parsed: FAILED")
-
-            return examples_found + 1
-
-        # Check children
-        if "Children" in node and isinstance(node["Children"], list):
-            for child in node["Children"]:
-                examples_found = find_sensor_locations(child, current_path, max_examples, examples_found)
-                if examples_found >= max_examples:
-                    break
-
-    return examples_found
-
-
-def count_sensors(node):
-    """Recursively count sensors in JSON tree"""
-    count = 0
-
-    if isinstance(node, dict):
-        # Check if this node is a sensor - must have Type and Value fields
         if "Type" in node and "Value" in node:
-            # Make sure it's a real sensor with a valid value (not just structure nodes)
-            value = node.get("Value")
-            if value is not None and str(value).strip() and str(value).lower() not in ["n/a", "", "null"]:
-                count += 1
-
-        # Check children recursively
-        if "Children" in node and isinstance(node["Children"], list):
-            for child in node["Children"]:
-                count += count_sensors(child)
-
-    return count
-
-
-def investigate_cpu_gpu_sensors(node, path=""):
-    """Special investigation to find CPU/GPU sensors"""
-    if isinstance(node, dict):
-        current_path = f"{path}/{node.get('Text', 'Unknown')}" if node.get('Text') else path
-        node_text = node.get('Text', '').lower()
-
-        # Look for CPU or GPU hardware
-        if any(keyword in node_text for keyword in ['ryzen', 'intel', 'cpu', 'processor', 'geforce', 'radeon', 'nvidia', 'amd']):
-            if any(keyword in node_text for keyword in ['ryzen', 'intel', 'cpu', 'processor']):
-                hardware_type = "CPU"
-            else:
-                hardware_type = "GPU"
-
-            print(f"  🔍 Investigating {hardware_type}: {node.get('Text', 'Unknown')}")
-
-            if "Children" in node:
-                for category in node.get("Children", []):
-                    if isinstance(category, dict) and "Text" in category:
-                        category_name = category["Text"]
-                        category_sensors = count_sensors(category)
-                        print(f"    📂 {category_name}: {category_sensors} sensors")
-                        
-                        # Show sample sensors from each category
-                        if category_sensors > 0:
-                            sample_count = find_and_show_sensors(category, depth=0, max_sensors=2, sensors_found=0)
-        
-        # Continue searching in children
-        if "Children" in node and isinstance(node["Children"], list):
-            for child in node["Children"]:
-                investigate_cpu_gpu_sensors(child, current_path)
-
-
-def investigate_fan_sensors(node, current_path=""):
-    """Special investigation for fan sensors across all hardware components"""
-    if isinstance(node, dict):
-        node_text = node.get("Text", "").lower()
-        current_path = f"{current_path}/{node.get('Text', 'Unknown')}" if node.get("Text") else current_path
-        
-        # Look for fan sensors in any hardware component
-        if "Children" in node:
-            fan_categories = []
-            all_fans = []
+            sensor_name = node.get("Text", "Unknown")
+            sensor_type = node.get("Type")
+            value_str = node.get("Value", "")
             
-            # Check if this node has fan categories or fan sensors
-            for child in node.get("Children", []):
-                if isinstance(child, dict):
-                    child_text = child.get("Text", "").lower()
-                    
-                    # Check if this is a fan category
-                    if "fan" in child_text:
-                        fan_count = count_sensors(child)
-                        if fan_count > 0:
-                            fan_categories.append((child["Text"], fan_count, child))
-                    
-                    # Check if this child contains fan sensors
-                    elif "Children" in child:
-                        for grandchild in child.get("Children", []):
-                            if isinstance(grandchild, dict) and "fan" in grandchild.get("Text", "").lower():
-                                grandchild_count = count_sensors(grandchild)
-                                if grandchild_count > 0:
-                                    fan_categories.append((f"{child['Text']}/{grandchild['Text']}", grandchild_count, grandchild))
+            # Parse value - a numeric RawValue needs no string cleanup at all
+            numeric_value = numeric_raw_value(node)
+            if numeric_value is None:
+                try:
+                    if isinstance(value_str, (int, float)):
+                        numeric_value = float(value_str)
+                    else:
+                        # Parse formatted string (e.g., "45.2 °C", "1850 RPM")
+                        cleaned = clean_sensor_value(value_str)
+                        numeric_value = float(cleaned) if cleaned else 0
+                except:
+                    numeric_value = 0
             
-            # Display fan information if found
-            if fan_categories:
-                print(f"  🌬️ Found fans in {node.get('Text', 'Unknown')}:")
-                for category_name, fan_count, category_node in fan_categories:
-                    print(f"    📂 {category_name}: {fan_count} fan sensors")
-                    
-                    # Show actual fan sensors with values
-                    if "Children" in category_node:
-                        for fan_sensor in category_node.get("Children", []):
-                            if isinstance(fan_sensor, dict) and "Value" in fan_sensor:
-                                fan_name = fan_sensor.get("Text", "Unknown")
-                                fan_value = fan_sensor.get("Value", "N/A")
-                                fan_type = fan_sensor.get("Type", "Unknown")
-                                print(f"      🌀 {fan_name}: {fan_value} ({fan_type})")
-                                
-                                # Parse and show RPM value
-                                try:
-                                    if fan_value and "RPM" in str(fan_value):
-                                        rpm_str = str(fan_value).replace("RPM", "").replace(",", ".").strip()
-                                        rpm_value = float(rpm_str)
-                                        status = "🔴 Stopped" if rpm_value == 0 else "🟢 Running" if rpm_value < 1000 else "🟡 High Speed"
-                                        print(f"        Status: {status} ({rpm_value} RPM)")
-                                except:
-                                    pass
-        
-        # Continue searching in children
-        if "Children" in node and isinstance(node["Children"], list):
-            for child in node["Children"]:
-                investigate_fan_sensors(child, current_path)
+            if numeric_value >= 0:  # Only include valid values
+                sensor_data = {
+                    "SensorType": sensor_type,
+                    "Name": sensor_name,
+                    "Value": numeric_value,
+                    "Parent": current_path
+                }
+                sensors.append(sensor_data)
+
+        # Queue children
+        children = node.get("Children")
+        if isinstance(children, list):
+            push((child, current_path) for child in reversed(children))
+
+    return sensors
 
 
 if __name__ == "__main__":
@@ -680,6 +491,7 @@ Examples:
   python sensor_discovery.py --method http      # Force HTTP API only  
   python sensor_discovery.py --method wmi       # Force WMI only
   python sensor_discovery.py --host 192.168.1.100  # Remote system
+  python sensor_discovery.py --debug            # Show parent path mapping
         """
     )
 
@@ -700,6 +512,11 @@ Examples:
         default=8085,
         help='LibreHardwareMonitor HTTP API port (default: 8085)'
     )
+    parser.add_argument(
+        '--debug',
+        action='store_true',
+        help='Show debug output (parent path to component mapping)'
+    )
 
     args = parser.parse_args()
     
@@ -707,5 +524,6 @@ Examples:
     test_connection_methods(
         host=args.host,
         port=args.port, 
-        method=args.method
+        method=args.method,
+        debug=args.debug
     )
\ No newline at end of file
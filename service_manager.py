@@ -120,6 +120,11 @@ class RigbeatService(win32serviceutil.ServiceFramework):
             logger.info(f"Sensor mode: {sensor_mode}")
             logger.info(f"LibreHardwareMonitor HTTP API target: {http_host}:{http_port}")
 
+            # Start Prometheus HTTP server first so /metrics answers during the
+            # (possibly slow) hardware detection below
+            start_http_server(port)
+            logger.info(f"Metrics available at http://localhost:{port}/metrics")
+
             # Initialize hardware monitor with HTTP API support and sensor filtering
             try:
                 monitor = HardwareMonitor(http_host=http_host, http_port=http_port, sensor_mode=sensor_mode)
@@ -147,17 +152,16 @@ class RigbeatService(win32serviceutil.ServiceFramework):
                 system_info.info(sys_info)
                 logger.info("Demo mode: Service will run without collecting metrics")
 
-            # Start Prometheus HTTP server
-            start_http_server(port)
-            logger.info(f"Metrics available at http://localhost:{port}/metrics")
-
-            # Main monitoring loop
+            # Main monitoring loop - sleep until a deadline rather than for a fixed
+            # time, so slow updates don't push every following update later
+            next_deadline = time.monotonic()
+            overrunning = False  # Warn when updates start overrunning, not on every cycle
             while self.running:
                 try:
                     if monitor and monitor.connected:
-                        start_time = time.time()
+                        start_time = time.monotonic()
                         monitor.update_metrics()
-                        update_duration = time.time() - start_time
+                        update_duration = time.monotonic() - start_time
 
                         # Log performance metrics for troubleshooting
                         if update_duration > 0.5:  # Log slow updates
@@ -167,7 +171,7 @@ class RigbeatService(win32serviceutil.ServiceFramework):
 
                         # Log sensor filtering effectiveness periodically (every 5 minutes)
                         # This helps verify the service is running efficiently
-                        current_time = time.time()
+                        current_time = time.monotonic()
                         if not hasattr(monitor, '_last_sensor_log') or (current_time - monitor._last_sensor_log) > 300:
                             # Get quick sensor count for status logging
                             sensors = monitor.get_sensors()
@@ -187,14 +191,24 @@ class RigbeatService(win32serviceutil.ServiceFramework):
                             logger.error("💡 Verify LibreHardwareMonitor Options → WMI Provider is enabled")
                     logger.error(f"Sensor mode: {sensor_mode} - consider switching to diagnostic mode for troubleshooting")
 
-                # Sleep with ability to interrupt
-                for _ in range(interval * 10):  # Check stop event every 0.1s
-                    if not self.running:
-                        break
-                    if win32event.WaitForSingleObject(self.stop_event, 100) == win32event.WAIT_OBJECT_0:
+                # Wait for the next deadline on the stop event, so a service stop
+                # interrupts the wait immediately
+                next_deadline += interval
+                sleep_for = next_deadline - time.monotonic()
+                if sleep_for > 0:
+                    if overrunning:
+                        logger.info("Metrics updates are back within the interval")
+                        overrunning = False
+                    if win32event.WaitForSingleObject(self.stop_event, int(sleep_for * 1000)) == win32event.WAIT_OBJECT_0:
                         self.running = False
-                        break
-                    time.sleep(0.1)
+                else:
+                    # Overran the interval - start the next update now and reschedule from here
+                    if overrunning:
+                        logger.debug(f"Metrics update overran the interval by {-sleep_for:.2f}s")
+                    else:
+                        logger.warning(f"Metrics update overran the interval by {-sleep_for:.2f}s (further overruns are logged at debug level)")
+                        overrunning = True
+                    next_deadline = time.monotonic()
 
         except ImportError as e:
             logger.error(f"Import error - missing dependencies: {e}")
@@ -205,6 +219,12 @@ class RigbeatService(win32serviceutil.ServiceFramework):
             servicemanager.LogErrorMsg(f"Service error: {e}")
         finally:
             logger.info("Service stopped")
+            # Release the monitor's connections before COM goes away
+            if monitor:
+                try:
+                    monitor.close()
+                except Exception:
+                    pass
             # Cleanup COM
             try:
                 pythoncom.CoUninitialize()
@@ -28,6 +28,11 @@ except ImportError:
     WMI_AVAILABLE = False
     wmi = None
 
+# Fan label patterns (matching main exporter) - compiled once at import
+_FAN_NUM_RE = re.compile(r'\d+')
+_FAN_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9_]')
+_FAN_COLLAPSE_RE = re.compile(r'_+')
+
 class LibreHardwareMonitorHTTP:
     """HTTP API client for fan testing"""
 
@@ -210,18 +215,13 @@ def test_fan_detection(http_host="localhost", http_port=8085, method="auto"):
     fans_by_type = defaultdict(list)
     all_fan_data = []
 
-    # Pre-compile regex patterns for performance (matching main exporter)
-    patterns = {
-        'numbers': re.compile(r'\d+'),
-        'sanitize': re.compile(r'[^a-zA-Z0-9_]'),
-        'underscore': re.compile(r'_+')
-    }
-
     for sensor in sensors:
         # Handle both HTTP API and WMI sensor formats
-        if hasattr(sensor, 'Name'):  # WMI format
+        if not isinstance(sensor, dict):  # WMI format
             # Only process fan sensors in WMI mode
-            if hasattr(sensor, 'SensorType') and sensor.SensorType != 'Fan':
+            # (each attribute read is a COM call - read SensorType once)
+            sensor_type = getattr(sensor, 'SensorType', None)
+            if sensor_type is not None and sensor_type != 'Fan':
                 continue
             sensor_name = sensor.Name
             # Fix: properly handle 0 values - only skip None/empty values
@@ -233,7 +233,8 @@ def test_fan_detection(http_host="localhost", http_port=8085, method="auto"):
             if sensor.get('SensorType') != 'Fan':
                 continue
             sensor_name = sensor.get('Name', 'Unknown')
-            value = float(sensor.get('Value', 0)) if sensor.get('Value') is not None else 0
+            raw_value = sensor.get('Value')
+            value = float(raw_value) if raw_value is not None else 0
             parent = sensor.get('Parent', 'Unknown')
 
         # Categorize using same logic as main exporter
@@ -241,30 +242,30 @@ def test_fan_detection(http_host="localhost", http_port=8085, method="auto"):
 
         if "gpu" in fan_name_lower or "vga" in fan_name_lower:
             fan_type = "GPU"
-            numbers = patterns['numbers'].findall(sensor_name)
-            if numbers:
-                fan_label = f"gpu_fan_{numbers[0]}"
+            number = _FAN_NUM_RE.search(sensor_name)
+            if number:
+                fan_label = f"gpu_fan_{number.group()}"
             else:
                 fan_label = "gpu_fan"
         elif "cpu" in fan_name_lower:
             fan_type = "CPU"
-            numbers = patterns['numbers'].findall(sensor_name)
-            if numbers:
-                fan_label = f"cpu_fan_{numbers[0]}"
+            number = _FAN_NUM_RE.search(sensor_name)
+            if number:
+                fan_label = f"cpu_fan_{number.group()}"
             else:
                 fan_label = "cpu_fan"
         elif "cha" in fan_name_lower or "chassis" in fan_name_lower or "case" in fan_name_lower:
             fan_type = "Chassis"
-            numbers = patterns['numbers'].findall(sensor_name)
-            if numbers:
-                fan_label = f"chassis_fan_{numbers[0]}"
+            number = _FAN_NUM_RE.search(sensor_name)
+            if number:
+                fan_label = f"chassis_fan_{number.group()}"
             else:
                 fan_label = "chassis_fan"
         else:
             fan_type = "Other"
             # Sanitize fan label for Prometheus
-            fan_label = patterns['sanitize'].sub('_', sensor_name.lower())
-            fan_label = patterns['underscore'].sub('_', fan_label).strip('_')
+            fan_label = _FAN_SANITIZE_RE.sub('_', sensor_name.lower())
+            fan_label = _FAN_COLLAPSE_RE.sub('_', fan_label).strip('_')
             if not fan_label:
                 fan_label = "unknown_fan"
 